@@ -6,12 +6,35 @@ Inspired by OpenCode's agent selection structure
 
 import json
 import os
+import re
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 
 
+# Local-mode actions in priority order: (action, field echoing the input, confidence)
+_LOCAL_ACTIONS = (
+    ("lock", "message", 0.8),
+    ("unlock", "message", 0.8),
+    ("plant", "description", 0.7),
+    ("add_comment", "comment", 0.8),
+    ("status", None, 0.9),
+)
+
+# One scan finds every keyword; the lookahead lets overlapping keywords
+# (e.g. "lock" inside "unlock") all be seen, as the old substring checks did
+_LOCAL_KEYWORDS = re.compile(
+    r"(?=(?:"
+    r"(?P<lock>잠가|잠금|lock|잠그)"
+    r"|(?P<unlock>풀어|해제|unlock|열어|잠금해제)"
+    r"|(?P<plant>보호|설치|만들어|plant|seed)"
+    r"|(?P<add_comment>코멘트|comment|메모|남겨)"
+    r"|(?P<status>상태|status|확인|보여)"
+    r"))"
+)
+
+
 class AssistantType(Enum):
     """AI Assistant types"""
     CLAUDE = "claude"
@@ -188,55 +211,24 @@ class AIAssistantManager:
 
     def _local_command_processing(self, user_input: str) -> Dict[str, Any]:
         """Local command processing without AI"""
-        user_input_lower = user_input.lower()
-
-        # Simple keyword matching
-        if any(keyword in user_input_lower for keyword in ['잠가', '잠금', 'lock', '잠그']):
-            return {
-                "action": "lock",
-                "message": user_input,
-                "path": ".",
-                "confidence": 0.8,
-                "assistant": "local"
-            }
-        elif any(keyword in user_input_lower for keyword in ['풀어', '해제', 'unlock', '열어', '잠금해제']):
-            return {
-                "action": "unlock",
-                "message": user_input,
-                "path": ".",
-                "confidence": 0.8,
-                "assistant": "local"
-            }
-        elif any(keyword in user_input_lower for keyword in ['보호', '설치', '만들어', 'plant', 'seed']):
-            return {
-                "action": "plant",
-                "description": user_input,
-                "path": ".",
-                "confidence": 0.7,
-                "assistant": "local"
-            }
-        elif any(keyword in user_input_lower for keyword in ['코멘트', 'comment', '메모', '남겨']):
-            return {
-                "action": "add_comment",
-                "comment": user_input,
-                "path": ".",
-                "confidence": 0.8,
-                "assistant": "local"
-            }
-        elif any(keyword in user_input_lower for keyword in ['상태', 'status', '확인', '보여']):
-            return {
-                "action": "status",
-                "path": ".",
-                "confidence": 0.9,
-                "assistant": "local"
-            }
-        else:
-            return {
-                "action": "unknown",
-                "message": "이해하지 못했습니다",
-                "confidence": 0.1,
-                "assistant": "local"
-            }
+        found = {m.lastgroup for m in _LOCAL_KEYWORDS.finditer(user_input.lower())}
+
+        for action, field, confidence in _LOCAL_ACTIONS:
+            if action in found:
+                result = {"action": action}
+                if field is not None:
+                    result[field] = user_input
+                result["path"] = "."
+                result["confidence"] = confidence
+                result["assistant"] = "local"
+                return result
+
+        return {
+            "action": "unknown",
+            "message": "이해하지 못했습니다",
+            "confidence": 0.1,
+            "assistant": "local"
+        }
 
     def _simulate_ai_response(self, assistant: AIAssistant, user_input: str) -> Dict[str, Any]:
         """Simulate AI response (replace with actual AI integration)"""
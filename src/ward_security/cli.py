@@ -8,52 +8,572 @@ import os
 import sys
 import subprocess
 import argparse
-import json
+import select
+import time
+from collections import defaultdict
+import functools
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Tuple
 import re
 
-# Import favorites functionality
-import sys
-import os
-sys.path.insert(0, os.path.dirname(__file__))
+if TYPE_CHECKING:
+    from .favorites import WardFavorites, WardPlanter
+    from .indexer import WardIndexer
+    from .ai_assistant import AIAssistantManager
+
+# Process-wide locations; these never change while the CLI is running
+_MODULE_DIR = Path(__file__).parent
+_WARD_ROOT = _MODULE_DIR.parent.parent
+_HOME = Path.home()
+_WARD_HOME = _HOME / ".ward"
+_LOCAL_BIN_WARD = _HOME / ".local/bin" / "ward"
+_HISTORY_FILE = _HOME / ".ward_history"
+
+# Interactive-mode history entries kept across sessions
+_HISTORY_LENGTH = 1000
+
+# Seconds mcp-test allows for server startup plus one JSON-RPC reply line
+_MCP_TEST_TIMEOUT = 10.0
+
+# Marker for lazily computed attributes that have not been filled in yet
+_UNSET = object()
+
+# Section rules shared by the printers
+_RULE_50 = "=" * 50
+_RULE_40 = "=" * 40
+_RULE_35 = "=" * 35
+_RULE_30 = "=" * 30
+_DASH_30 = "-" * 30
+
+# Default policy written by `ward init`, split around the description
+_WARD_INIT_PREFIX = b"# Ward Security Configuration\n@description: "
+_WARD_INIT_SUFFIX = (
+    b"\n"
+    b"@whitelist: ls cat pwd echo grep sed awk git python npm node code vim\n"
+    b"@blacklist: rm -rf / sudo su chmod chown docker kubectl\n"
+    b"@allow_comments: true\n"
+    b"@max_comments: 5\n"
+    b'@comment_prompt: "Explain changes from a security perspective"\n'
+)
+
+# Policy rules counted by _parse_ward, matched once per line start
+_POLICY_RE = re.compile(rb'^@(whitelist|blacklist):', re.MULTILINE)
+
+# Description line of a .ward policy, and the block read before looking
+# for it; ward init and WardPlanter put it in the first few lines
+_DESCRIPTION_RE = re.compile(rb'^@description:[^\r\n]*', re.MULTILINE)
+_DESCRIPTION_HEAD = 8192
+
+# Static part of the interactive-mode menu
+_INTERACTIVE_MENU = (
+    "🎯 **선택지:**\n"
+    "1. 🌱 현재 위치 보호하기 (Ward 설치)\n"
+    "2. 🔒 폴더 잠그기\n"
+    "3. 🔓 폴더 잠금 해제\n"
+    "4. 📝 코멘트 추가\n"
+    "5. ℹ️ 현재 상태 확인\n"
+    "6. 🔄 다른 위치로 이동\n"
+    "7. ❓ 도움말\n"
+    "0. 🚪 종료\n"
+    "\n"
+)
+
+# Interactive-mode help page
+_INTERACTIVE_HELP = (
+    "\n❓ **도움말**\n"
+    + _RULE_30 + "\n"
+    "🎯 **자연어 명령어 예시:**\n"
+    "• '여기 잠가줘' - 현재 위치 잠그기\n"
+    "• '보호해줘' - Ward 설치\n"
+    "• '코멘트 남겨줘' - 코멘트 추가\n"
+    "• '상태 확인' - 현재 상태 보기\n"
+    "• '이동해줘' - 디렉토리 변경\n"
+    "\n"
+    "🚪 **종료 명령어:**\n"
+    "• '종료', 'exit', 'quit', 'q', '0'\n"
+    "\n"
+    "💡 **팁:**\n"
+    "• 항상 현재 위치를 보여줍니다\n"
+    "• 자연어로 편하게 대화하세요\n"
+    "• 확인 절차가 있어 안전합니다\n"
+)
+
+# Printed after a Ward is planted from the CLI
+_PLANT_NOTICE = (
+    "⚠️ IMPORTANT SECURITY NOTICE:\n"
+    "• A password has been generated and stored for security\n"
+    "• To modify/remove this Ward, manually edit the password file\n"
+    "• The password file location is provided for manual user intervention\n"
+)
+
+# Interactive answers accepted as confirmation / as a request to leave
+_YES_WORDS = frozenset({"y", "yes", "예", "네"})
+_EXIT_WORDS = frozenset({"종료", "exit", "quit", "q", "0"})
+
+# Mode information added to locally processed natural-language results
+_TERMINAL_MODE_INFO = {"mode": "terminal", "processing": "local"}
+
+# Per-entry listing templates, rendered with str.format_map
+_FAVORITE_TEMPLATE = (
+    "{i}. {path} {exists}\n"
+    "   📝 Description: {description}\n"
+    "   🛡️ Status: {status}\n"
+    "   📅 Added: {added}\n"
+    "   🔄 Access count: {access_count}"
+)
+_SEARCH_RESULT_TEMPLATE = (
+    "{i}. 📁 {path} (Score: {score})\n"
+    "   📊 {total_files} files, {total_dirs} directories\n"
+    "   💾 Size: {total_size:,} bytes\n"
+    "   🔍 Matches: {matches}"
+)
+_BOOKMARK_TEMPLATE = (
+    "  {i}. 📁 {name}\n"
+    "     📍 {path}\n"
+    "     🏷️ Tags: {tags}\n"
+    "     🔄 Access count: {access_count}"
+)
+
+# Potential MCP server locations, in lookup order
+_MCP_PATHS = (
+    _WARD_HOME / "mcp" / "mcp_server.py",
+    _HOME / ".local/share/uv/tools/ward-security/lib/python3.11/site-packages/ward_security/mcp_server.py",
+    _MODULE_DIR / "mcp_server.py",  # Same directory as CLI
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_ward(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Summarize a .ward policy file (mtime/size are part of the cache key)"""
+    with open(path, 'rb') as f:
+        content = f.read()
+
+    # One regex pass over the raw bytes for the whitelist/blacklist rule counts
+    counts = {b'whitelist': 0, b'blacklist': 0}
+    for m in _POLICY_RE.finditer(content):
+        counts[m.group(1)] += 1
+    whitelist_count = counts[b'whitelist']
+    blacklist_count = counts[b'blacklist']
+
+    return {
+        "whitelist_count": whitelist_count,
+        "blacklist_count": blacklist_count,
+        "has_whitelist": whitelist_count > 0,
+        "has_blacklist": blacklist_count > 0,
+    }
+
+
+@functools.lru_cache(maxsize=128)
+def _ward_description(path: str, mtime_ns: int, size: int) -> Optional[str]:
+    """Return the first @description: line, reading past the first block only if needed"""
+    with open(path, 'rb') as f:
+        content = f.read(_DESCRIPTION_HEAD)
+        match = _DESCRIPTION_RE.search(content)
+        if match is None or match.end() == len(content):
+            # Not in the first block, or the line may continue past it
+            content += f.read()
+            match = _DESCRIPTION_RE.search(content)
+    return match.group(0).decode('utf-8') if match else None
+
+
+def _read_ward_description(ward_file: Path) -> Optional[str]:
+    """Return the cached description line of a .ward file"""
+    st = ward_file.stat()
+    return _ward_description(str(ward_file), st.st_mtime_ns, st.st_size)
+
+
+def _read_ward_summary(ward_file: Path) -> Dict[str, Any]:
+    """Return the cached summary of a .ward file, reparsing only when it changed"""
+    st = ward_file.stat()
+    return _parse_ward(str(ward_file), st.st_mtime_ns, st.st_size)
+
+
+def _exists_or_symlink(path: Path) -> bool:
+    """True if path exists or is a (possibly dangling) symlink, in one lstat"""
+    try:
+        os.lstat(path)
+        return True
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+def _load_readline_history() -> bool:
+    """Enable line editing for input() and load saved history; False if unavailable"""
+    try:
+        import readline
+    except ImportError:
+        return False
+
+    readline.set_history_length(_HISTORY_LENGTH)
+    try:
+        readline.read_history_file(_HISTORY_FILE)
+    except OSError:
+        pass
+    return True
+
+
+def _save_readline_history() -> None:
+    """Persist interactive history; losing it is not worth an error"""
+    import readline
+    try:
+        readline.write_history_file(_HISTORY_FILE)
+    except OSError:
+        pass
+
+
+def _write_comment_file(comment_file: Path, comment: str, author: str) -> None:
+    """Write a .ward_comment.txt in one write, replacing any old one atomically"""
+    content = (
+        f"💬 Comment: {comment}\n"
+        f"📅 Added: {datetime.now():%Y-%m-%d %H:%M:%S}\n"
+        f"👤 By: {author}\n"
+    )
+    tmp_file = comment_file.with_name(comment_file.name + ".tmp")
+    tmp_file.write_bytes(content.encode("utf-8"))
+    os.replace(tmp_file, comment_file)
+
+
+def _write_executable_script(path: Path, payload: bytes) -> None:
+    """Write an executable script, skipping the write when it is already current"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        st = None
+
+    if st is not None and st.st_size == len(payload) and (st.st_mode & 0o755) == 0o755:
+        with open(path, "rb") as f:
+            if f.read() == payload:
+                return
+
+    # Created executable in one step; an existing file keeps its old mode, so fix it
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+    with os.fdopen(fd, "wb") as f:
+        if st is not None:
+            os.fchmod(fd, 0o755)
+        # File.write() retries short writes until the whole payload is out
+        f.write(payload)
+
+
+def _dumps_json(obj: Any) -> str:
+    """Pretty-print obj as JSON, using orjson when it is installed"""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+
+def _format_timestamp(timestamp: str) -> str:
+    """Render an ISO timestamp as 'YYYY-MM-DD HH:MM:SS'"""
+    # isoformat() output already carries that prefix; only parse unusual input
+    if len(timestamp) >= 19 and timestamp[10] == "T":
+        return timestamp[:10] + " " + timestamp[11:19]
+    return datetime.fromisoformat(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _shorten(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking a cut with '...'"""
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+def _decode_output(data: bytes) -> str:
+    """Decode captured subprocess output for display"""
+    return data.decode("utf-8", errors="replace")
+
+
+@functools.lru_cache(maxsize=1)
+def _package_version() -> str:
+    """Resolve the version (only needed for --version)"""
+    # Installed packages carry it in their metadata; no TOML parsing needed
+    from importlib import metadata
+    try:
+        return metadata.version("ward-security")
+    except metadata.PackageNotFoundError:
+        pass
+
+    # Running from a source checkout: fall back to pyproject.toml
+    version = "2.0.3"  # Will be updated during build
+    try:
+        if sys.version_info >= (3, 11):
+            import tomllib
+        else:
+            import tomli as tomllib
+
+        pyproject_path = _WARD_ROOT / "pyproject.toml"
+        if pyproject_path.exists():
+            with open(pyproject_path, "rb") as f:
+                pyproject = tomllib.load(f)
+                version = pyproject["project"]["version"]
+    except (ImportError, FileNotFoundError, KeyError):
+        pass
+    return version
+
+
+class VersionAction(argparse.Action):
+    """Print the version and exit, resolving it only when requested"""
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help=None):
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        sys.stdout.write(f"Ward Security v{_package_version()}\n")
+        parser.exit()
+
+
+class JoinWordsAction(argparse.Action):
+    """Store a nargs='*' positional as a single space-joined string"""
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        setattr(namespace, self.dest, " ".join(values))
+
+
+def split_tags(value: str) -> List[str]:
+    """Parse a comma-separated tag list, dropping empty items"""
+    return [tag for tag in (item.strip() for item in value.split(",")) if tag]
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Construct the ward argument parser (built once per process)"""
+    parser = argparse.ArgumentParser(
+        prog="ward",
+        description="Ward Security System - AI-powered terminal protection"
+    )
+
+    parser.add_argument(
+        "--version",
+        action=VersionAction,
+        help="show program's version number and exit"
+    )
+
+    parser.add_argument(
+        "--mcp",
+        action="store_true",
+        help="Run Ward as MCP server"
+    )
+
+    # Create subparsers for commands
+    subparsers = parser.add_subparsers(
+        dest="command",
+        title="Commands",
+        description="Available commands",
+        metavar="COMMAND"
+    )
+
+    # Core commands
+    subparsers.add_parser("status", help="Show Ward system status")
+    subparsers.add_parser("validate", help="Validate security policies")
+
+    # Path analysis
+    check_parser = subparsers.add_parser("check", help="Check security policies for path")
+    check_parser.add_argument("path", nargs="?", default=".", help="Path to check (default: current directory)")
+
+    # Init command
+    init_parser = subparsers.add_parser("init", help="Initialize Ward in a directory")
+    init_parser.add_argument("path", nargs="?", default=".", help="Directory path to initialize (default: current directory)")
+    init_parser.add_argument("--description", help="Custom description for the Ward policy")
+
+    # MCP integration
+    subparsers.add_parser("mcp-status", help="Check MCP server status")
+    subparsers.add_parser("mcp-test", help="Test MCP server functionality")
+    subparsers.add_parser("configure-claude", help="Configure Claude Desktop integration")
+
+    # Favorites management
+    fav_parser = subparsers.add_parser("favorites", help="Manage favorites")
+    fav_subparsers = fav_parser.add_subparsers(dest="fav_action")
+
+    fav_list = fav_subparsers.add_parser("list", help="List favorites")
+    fav_add = fav_subparsers.add_parser("add", help="Add to favorites")
+    fav_add.add_argument("path", help="Path to add")
+    fav_add.add_argument("description", nargs="*", action=JoinWordsAction, help="Description")
+    fav_comment = fav_subparsers.add_parser("comment", help="Add comment")
+    fav_comment.add_argument("path", help="Path to comment on")
+    fav_comment.add_argument("comment", help="Comment text")
+    fav_comment.add_argument("author", nargs="?", default="CLI User", help="Comment author")
+
+    # Ward management
+    plant_parser = subparsers.add_parser("plant", help="Plant a Ward (protection)")
+    plant_parser.add_argument("path", nargs="?", default=".", help="Path to protect (defaults to current directory)")
+    plant_parser.add_argument("description", nargs="*", action=JoinWordsAction, help="Description (optional - if not provided, creates description-only Ward with all permissions)")
+
+    lock_parser = subparsers.add_parser("lock", help="Lock directory with restriction message")
+    lock_parser.add_argument("message", help="Lock restriction message")
+    lock_parser.add_argument("path", nargs="?", default=".", help="Path to lock (defaults to current directory)")
+
+    unlock_parser = subparsers.add_parser("unlock", help="Unlock directory with permission message")
+    unlock_parser.add_argument("message", help="Unlock permission message")
+    unlock_parser.add_argument("path", nargs="?", default=".", help="Path to unlock (defaults to current directory)")
+
+    info_parser = subparsers.add_parser("info", help="Get Ward information")
+    info_parser.add_argument("path", help="Path to check")
+
+    # Add command with subcommands
+    add_parser = subparsers.add_parser("add", help="Add various items to Ward")
+    add_subparsers = add_parser.add_subparsers(dest="add_action")
+
+    add_comment_parser = add_subparsers.add_parser("comment", help="Add comment to current directory")
+    add_comment_parser.add_argument("comment", help="Comment text")
+    add_comment_parser.add_argument("path", nargs="?", default=".", help="Path to comment on (defaults to current directory)")
+
+    # Search and bookmarks
+    search_parser = subparsers.add_parser("search", help="Search through indexed folders")
+    search_parser.add_argument("query", help="Search query")
+    search_parser.add_argument("--in", choices=["all", "name", "files", "directories", "types"], default="all", help="Search scope")
+    search_parser.add_argument("--limit", type=int, default=20, help="Result limit")
+
+    bookmark_parser = subparsers.add_parser("bookmark", help="Manage bookmarks")
+    bookmark_subparsers = bookmark_parser.add_subparsers(dest="bookmark_action")
+
+    bookmark_add = bookmark_subparsers.add_parser("add", help="Add bookmark")
+    bookmark_add.add_argument("path", help="Path to bookmark")
+    bookmark_add.add_argument("--category", default="default", help="Bookmark category")
+    bookmark_add.add_argument("--name", help="Bookmark name")
+    bookmark_add.add_argument("--desc", help="Description")
+    bookmark_add.add_argument("--tags", type=split_tags, default=[], help="Comma-separated tags")
+
+    bookmark_list = bookmark_subparsers.add_parser("list", help="List bookmarks")
+    bookmark_list.add_argument("--category", help="Filter by category")
+    bookmark_list.add_argument("--tags", type=split_tags, default=[], help="Filter by tags")
+
+    recent_parser = subparsers.add_parser("recent", help="Show recent access")
+    recent_parser.add_argument("--hours", type=int, default=24, help="Hours to look back")
+    recent_parser.add_argument("--limit", type=int, default=20, help="Result limit")
+
+    # MCP server command
+    subparsers.add_parser("mcp-server", help="Run Ward as MCP server")
+
+    # AI Assistant commands
+    ai_parser = subparsers.add_parser("ai", help="Manage AI assistants")
+    ai_subparsers = ai_parser.add_subparsers(dest="ai_action")
+
+    ai_list_parser = ai_subparsers.add_parser("list", help="List available AI assistants")
+    ai_select_parser = ai_subparsers.add_parser("select", help="Select AI assistant")
+    ai_select_parser.add_argument("assistant_name", help="Name of assistant to select")
+
+    # Environment activation (new mode system)
+    activate_parser = subparsers.add_parser("activate", help="Activate Ward Shell mode (AI-assisted)")
+    deactivate_parser = subparsers.add_parser("deactivate", help="Deactivate Ward Shell mode (normal terminal)")
+
+    # Natural language processing
+    process_parser = subparsers.add_parser("process", help="Process natural language command (JSON output)")
+    process_parser.add_argument("text", metavar="command", help="Natural language command to process")
+
+    # Interactive mode
+    subparsers.add_parser("interactive", help="Start interactive Ward management mode")
+
+    # Help and version
+    subparsers.add_parser("help", help="Show this help message")
+
+    return parser
 
-from favorites import WardFavorites, WardPlanter
-from indexer import WardIndexer
-from ai_assistant import AIAssistantManager, AssistantType
 
 class WardCLI:
     """Ward Security Command Line Interface"""
 
+    __slots__ = (
+        "ward_root",
+        "ward_cli_path",
+        "ward_home",
+        "mcp_server_path",
+        "ward_shell_mode",
+        "_processor_fn",
+        "_favorites",
+        "_planter",
+        "_ai_manager",
+        "_indexer",
+        "_mcp_location",
+        "_cli_ready",
+    )
+
     def __init__(self):
-        self.ward_root = Path(__file__).parent.parent.parent
-        self.ward_cli_path = self.ward_root / ".ward" / "ward.sh"
-        self.ward_home = Path.home() / ".ward"
-        self.mcp_server_path = self.ward_home / "mcp" / "mcp_server.py"
-        self.favorites = WardFavorites()
-        self.planter = WardPlanter()
-        self.ai_manager = AIAssistantManager()
+        self.ward_root = _WARD_ROOT
+        self.ward_cli_path = _WARD_ROOT / ".ward" / "ward.sh"
+        self.ward_home = _WARD_HOME
+        self.mcp_server_path = _MCP_PATHS[0]
         self.ward_shell_mode = False  # Track if we're in Ward Shell mode
-        self.indexer = WardIndexer()
+        self._processor_fn = self._terminal_processing  # Rebound on activate/deactivate
+        # Feature managers are imported and constructed on first use
+        self._favorites: Optional["WardFavorites"] = None
+        self._planter: Optional["WardPlanter"] = None
+        self._ai_manager: Optional["AIAssistantManager"] = None
+        self._indexer: Optional["WardIndexer"] = None
+        self._mcp_location = _UNSET
+        self._cli_ready = False
+
+    @property
+    def favorites(self) -> "WardFavorites":
+        """Favorites manager"""
+        if self._favorites is None:
+            from .favorites import WardFavorites
+            self._favorites = WardFavorites()
+        return self._favorites
+
+    @property
+    def planter(self) -> "WardPlanter":
+        """Ward planter"""
+        if self._planter is None:
+            from .favorites import WardPlanter
+            self._planter = WardPlanter()
+        return self._planter
+
+    @property
+    def ai_manager(self) -> "AIAssistantManager":
+        """AI assistant manager"""
+        if self._ai_manager is None:
+            from .ai_assistant import AIAssistantManager
+            self._ai_manager = AIAssistantManager()
+        return self._ai_manager
+
+    @property
+    def indexer(self) -> "WardIndexer":
+        """Folder indexer"""
+        if self._indexer is None:
+            from .indexer import WardIndexer
+            self._indexer = WardIndexer()
+        return self._indexer
+
+    def _prepare_ward_cli(self) -> bool:
+        """Check the bash CLI exists and is executable (once per process)"""
+        if self._cli_ready:
+            return True
 
-    def run_ward_command(self, args: List[str]) -> int:
-        """Execute Ward CLI command"""
-        if not self.ward_cli_path.exists():
+        try:
+            st = os.stat(self.ward_cli_path)
+        except (FileNotFoundError, NotADirectoryError):
             print("Error: Ward CLI not found. Please run 'ward init' first.", file=sys.stderr)
-            return 1
+            return False
+
+        # Ensure the CLI is executable, reusing the stat from above
+        if (st.st_mode & 0o111) != 0o111:
+            os.chmod(self.ward_cli_path, st.st_mode | 0o755)
+        self._cli_ready = True
+        return True
 
+    def run_ward_command(self, args: List[str]) -> int:
+        """Execute Ward CLI command"""
         try:
-            # Ensure the CLI is executable
-            os.chmod(self.ward_cli_path, 0o755)
+            if not self._prepare_ward_cli():
+                return 1
 
-            # Execute the bash CLI
-            result = subprocess.run(
+            # Execute the bash CLI; no fds worth hiding, so skip the close loop
+            proc = subprocess.Popen(
                 [str(self.ward_cli_path)] + args,
                 cwd=self.ward_root,
-                check=False
+                close_fds=False
             )
-            return result.returncode
+            try:
+                return proc.wait()
+            except KeyboardInterrupt:
+                # Don't leave the bash CLI running behind an interrupted ward
+                proc.terminate()
+                try:
+                    proc.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait()
+                raise
 
         except Exception as e:
             print(f"Error executing Ward command: {e}", file=sys.stderr)
@@ -71,57 +591,56 @@ class WardCLI:
             print(f"Error running MCP server: {e}", file=sys.stderr)
             return 1
 
+    # Interactive menu numbers mapped to their handler method names
+    _MENU_ACTIONS = {
+        1: "_interactive_plant_ward",
+        2: "_interactive_lock_directory",
+        3: "_interactive_unlock_directory",
+        4: "_interactive_add_comment",
+        5: "_interactive_check_status",
+        6: "_interactive_change_directory",
+        7: "_interactive_show_help",
+    }
+
     def handle_interactive_mode(self) -> int:
         """Handle interactive mode with conversational interface"""
         print("🛡️ Ward Security System - Interactive Mode")
-        print("=" * 50)
+        print(_RULE_50)
         print("👋 안녕하세요! Ward 도우미입니다. 무엇을 도와드릴까요?")
         print("📝 자연어로 말씀하시거나, 메뉴 번호를 선택하세요.")
         print("🚪 '종료', 'exit', 'quit' 또는 'q'를 입력하면 나갈 수 있습니다.")
         print()
 
+        has_readline = _load_readline_history()
+        try:
+            return self._interactive_loop()
+        finally:
+            if has_readline:
+                _save_readline_history()
+
+    def _interactive_loop(self) -> int:
+        """Prompt for menu numbers or natural language until the user exits"""
         while True:
-            current_dir = Path.cwd()
-            ward_status = "🛡️ 활성화" if (current_dir / ".ward").exists() else "⚪ 비활성화"
+            # Taken once per prompt and handed to the menu handlers
+            current_dir = os.getcwd()
+            ward_status = "🛡️ 활성화" if os.path.exists(os.path.join(current_dir, ".ward")) else "⚪ 비활성화"
 
-            print(f"📍 현재 위치: {current_dir} ({ward_status})")
-            print()
-            print("🎯 **선택지:**")
-            print("1. 🌱 현재 위치 보호하기 (Ward 설치)")
-            print("2. 🔒 폴더 잠그기")
-            print("3. 🔓 폴더 잠금 해제")
-            print("4. 📝 코멘트 추가")
-            print("5. ℹ️ 현재 상태 확인")
-            print("6. 🔄 다른 위치로 이동")
-            print("7. ❓ 도움말")
-            print("0. 🚪 종료")
-            print()
+            sys.stdout.write(f"📍 현재 위치: {current_dir} ({ward_status})\n\n" + _INTERACTIVE_MENU)
+            sys.stdout.flush()
 
             try:
                 user_input = input("💬 입력: ").strip()
 
                 # 종료 명령 확인
-                if user_input.lower() in ['종료', 'exit', 'quit', 'q', '0']:
+                if user_input.lower() in _EXIT_WORDS:
                     print("👋 안녕히 가세요!")
                     break
 
                 # 메뉴 번호 처리
                 if user_input.isdigit():
-                    choice = int(user_input)
-                    if choice == 1:
-                        self._interactive_plant_ward()
-                    elif choice == 2:
-                        self._interactive_lock_directory()
-                    elif choice == 3:
-                        self._interactive_unlock_directory()
-                    elif choice == 4:
-                        self._interactive_add_comment()
-                    elif choice == 5:
-                        self._interactive_check_status()
-                    elif choice == 6:
-                        self._interactive_change_directory()
-                    elif choice == 7:
-                        self._interactive_show_help()
+                    handler = self._MENU_ACTIONS.get(int(user_input))
+                    if handler is not None:
+                        getattr(self, handler)(current_dir)
                     else:
                         print("❌ 잘못된 번호입니다. 다시 선택해주세요.")
                     continue
@@ -138,20 +657,20 @@ class WardCLI:
 
         return 0
 
-    def _interactive_plant_ward(self):
+    def _interactive_plant_ward(self, cwd: str):
         """대화형으로 Ward 설치"""
         print("\n🌱 **현재 위치 보호하기**")
-        print("=" * 30)
+        print(_RULE_30)
 
         description = input("📝 설명 (없으면 엔터): ").strip()
         if not description:
             description = "이 폴더는 건드리면 안된다"
 
-        print(f"📍 위치: {Path.cwd()}")
+        print(f"📍 위치: {cwd}")
         print(f"📝 설명: {description}")
 
         confirm = input("✅ 이대로 설치할까요? (y/n): ").strip().lower()
-        if confirm in ['y', 'yes', '예', '네']:
+        if confirm in _YES_WORDS:
             result = self.plant_ward_cli(".", description)
             if result == 0:
                 print("✅ 성공적으로 설치되었습니다!")
@@ -161,12 +680,12 @@ class WardCLI:
         else:
             print("❌ 취소되었습니다.")
 
-    def _interactive_lock_directory(self):
+    def _interactive_lock_directory(self, cwd: str):
         """대화형으로 디렉토리 잠그기"""
         print("\n🔒 **폴더 잠그기**")
-        print("=" * 30)
+        print(_RULE_30)
 
-        path = input(f"📍 경로 (현재: {Path.cwd()}): ").strip()
+        path = input(f"📍 경로 (현재: {cwd}): ").strip()
         if not path:
             path = "."
 
@@ -178,7 +697,7 @@ class WardCLI:
         print(f"📝 메시지: {message}")
 
         confirm = input("🔒 이대로 잠글까요? (y/n): ").strip().lower()
-        if confirm in ['y', 'yes', '예', '네']:
+        if confirm in _YES_WORDS:
             result = self.plant_ward_cli(path, f"🔒 LOCKED: {message}")
             if result == 0:
                 print("✅ 성공적으로 잠겼습니다!")
@@ -188,12 +707,12 @@ class WardCLI:
         else:
             print("❌ 취소되었습니다.")
 
-    def _interactive_unlock_directory(self):
+    def _interactive_unlock_directory(self, cwd: str):
         """대화형으로 디렉토리 잠금 해제"""
         print("\n🔓 **폴더 잠금 해제**")
-        print("=" * 30)
+        print(_RULE_30)
 
-        path = input(f"📍 경로 (현재: {Path.cwd()}): ").strip()
+        path = input(f"📍 경로 (현재: {cwd}): ").strip()
         if not path:
             path = "."
 
@@ -205,7 +724,7 @@ class WardCLI:
         print(f"📝 메시지: {message}")
 
         confirm = input("🔓 이대로 잠금 해제할까요? (y/n): ").strip().lower()
-        if confirm in ['y', 'yes', '예', '네']:
+        if confirm in _YES_WORDS:
             result = self.plant_ward_cli(path, f"🔓 UNLOCKED: {message}")
             if result == 0:
                 print("✅ 성공적으로 잠금 해제되었습니다!")
@@ -215,27 +734,24 @@ class WardCLI:
         else:
             print("❌ 취소되었습니다.")
 
-    def _interactive_add_comment(self):
+    def _interactive_add_comment(self, cwd: str):
         """대화형으로 코멘트 추가"""
         print("\n📝 **코멘트 추가**")
-        print("=" * 30)
+        print(_RULE_30)
 
         comment = input("💬 코멘트 내용: ").strip()
         if not comment:
             print("❌ 코멘트 내용을 입력해주세요.")
             return
 
-        print(f"📍 위치: {Path.cwd()}")
+        print(f"📍 위치: {cwd}")
         print(f"💬 코멘트: {comment}")
 
         confirm = input("✅ 이대로 추가할까요? (y/n): ").strip().lower()
-        if confirm in ['y', 'yes', '예', '네']:
-            comment_file = Path.cwd() / ".ward_comment.txt"
+        if confirm in _YES_WORDS:
+            comment_file = Path(cwd, ".ward_comment.txt")
             try:
-                with open(comment_file, 'w', encoding='utf-8') as f:
-                    f.write(f"💬 Comment: {comment}\n")
-                    f.write(f"📅 Added: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write(f"👤 By: Interactive User\n")
+                _write_comment_file(comment_file, comment, "Interactive User")
                 print("✅ 코멘트가 추가되었습니다!")
                 print(f"📍 위치: {comment_file}")
             except Exception as e:
@@ -243,43 +759,28 @@ class WardCLI:
         else:
             print("❌ 취소되었습니다.")
 
-    def _interactive_check_status(self):
+    def _interactive_check_status(self, cwd: str):
         """대화형으로 상태 확인"""
         print("\nℹ️ **현재 상태 확인**")
-        print("=" * 30)
+        print(_RULE_30)
         self.ward_info_cli(".")
 
-    def _interactive_change_directory(self):
+    def _interactive_change_directory(self, cwd: str):
         """대화형으로 디렉토리 변경"""
         print("\n🔄 **디렉토리 변경**")
-        print("=" * 30)
+        print(_RULE_30)
 
-        new_path = input(f"📍 새 경로 (현재: {Path.cwd()}): ").strip()
+        new_path = input(f"📍 새 경로 (현재: {cwd}): ").strip()
         if new_path:
             try:
                 os.chdir(new_path)
-                print(f"✅ {Path.cwd()}로 이동했습니다.")
+                print(f"✅ {os.getcwd()}로 이동했습니다.")
             except Exception as e:
                 print(f"❌ 이동 실패: {e}")
 
-    def _interactive_show_help(self):
+    def _interactive_show_help(self, cwd: str):
         """대화형 도움말 표시"""
-        print("\n❓ **도움말**")
-        print("=" * 30)
-        print("🎯 **자연어 명령어 예시:**")
-        print("• '여기 잠가줘' - 현재 위치 잠그기")
-        print("• '보호해줘' - Ward 설치")
-        print("• '코멘트 남겨줘' - 코멘트 추가")
-        print("• '상태 확인' - 현재 상태 보기")
-        print("• '이동해줘' - 디렉토리 변경")
-        print()
-        print("🚪 **종료 명령어:**")
-        print("• '종료', 'exit', 'quit', 'q', '0'")
-        print()
-        print("💡 **팁:**")
-        print("• 항상 현재 위치를 보여줍니다")
-        print("• 자연어로 편하게 대화하세요")
-        print("• 확인 절차가 있어 안전합니다")
+        sys.stdout.write(_INTERACTIVE_HELP)
 
     def _process_natural_language(self, user_input: str):
         """AI assistant 기반 자연어 처리"""
@@ -340,10 +841,7 @@ class WardCLI:
             print(f"💬 '{path}'에 코멘트를 추가합니다...")
             comment_file = Path(path) / ".ward_comment.txt"
             try:
-                with open(comment_file, 'w', encoding='utf-8') as f:
-                    f.write(f"💬 Comment: {comment}\n")
-                    f.write(f"📅 Added: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write(f"👤 By: Interactive User\n")
+                _write_comment_file(comment_file, comment, "Interactive User")
                 print("✅ 코멘트가 추가되었습니다!")
                 print(f"📍 위치: {comment_file}")
             except Exception as e:
@@ -409,6 +907,8 @@ class WardCLI:
         print("🤖 AI Assistant integration enabled")
         print("📋 All commands will be processed through AI assistant")
 
+        from .ai_assistant import AssistantType
+
         # Check if AI assistant is configured
         active_assistant = self.ai_manager.get_active_assistant()
         if not active_assistant or active_assistant.type == AssistantType.NONE:
@@ -420,26 +920,26 @@ class WardCLI:
             print("🔄 Continuing with local processing...")
 
         self.ward_shell_mode = True
+        self._processor_fn = self.ai_manager.process_command_with_ai
+
+        # Read the environment once; changes are applied in a single update
+        env = os.environ
+        current_ps1 = env.get("PS1", "")
 
         # Save original PS1 if not already saved
-        original_ps1 = os.environ.get("WARD_ORIGINAL_PS1")
-        if not original_ps1:
-            original_ps1 = os.environ.get("PS1", "")
-            os.environ["WARD_ORIGINAL_PS1"] = original_ps1
+        original_ps1 = env.get("WARD_ORIGINAL_PS1") or current_ps1
 
         # Create Ward Shell enhanced prompt
-        current_ps1 = os.environ.get("PS1", "")
         ward_prefix = "🛡️⚡️ "  # Shield + lightning for AI mode
 
         # Check if Ward prefix already exists
         if ward_prefix not in current_ps1:
             new_ps1 = f"{ward_prefix}{current_ps1}"
-            os.environ["PS1"] = new_ps1
+            env.update({"WARD_ORIGINAL_PS1": original_ps1, "PS1": new_ps1})
 
             # Create Ward Shell activation script
-            activation_script = Path.home() / ".ward-shell-activate.sh"
-            with open(activation_script, 'w') as f:
-                f.write(f"""#!/bin/bash
+            activation_script = _HOME / ".ward-shell-activate.sh"
+            payload = f"""#!/bin/bash
 # Ward Shell Activation (AI Assistant Mode)
 export WARD_SHELL_MODE=true
 export WARD_ORIGINAL_PS1="${{WARD_ORIGINAL_PS1:-$PS1}}"
@@ -447,8 +947,8 @@ export PS1="{new_ps1}"
 echo "🛡️⚡️ Ward Shell activated (AI Assistant Mode)"
 echo "💡 All commands processed through AI assistant"
 echo "🔧 Use 'ward deactivate' to return to normal terminal"
-""")
-            activation_script.chmod(0o755)
+""".encode("utf-8")
+            _write_executable_script(activation_script, payload)
 
             print("✅ Ward Shell activated!")
             print(f"📌 Original prompt saved")
@@ -463,6 +963,7 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
             print(f"   source {activation_script}")
             return 0
         else:
+            env["WARD_ORIGINAL_PS1"] = original_ps1
             print("✅ Ward Shell is already active!")
             return 1
 
@@ -472,6 +973,7 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
         print("💻 Returning to normal terminal mode")
 
         self.ward_shell_mode = False
+        self._processor_fn = self._terminal_processing
 
         try:
             # Restore original PS1
@@ -484,7 +986,7 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
                 print("⚠️  No original prompt found - keeping current prompt")
 
             # Remove activation script if it exists
-            activation_script = Path.home() / ".ward-shell-activate.sh"
+            activation_script = _HOME / ".ward-shell-activate.sh"
             if activation_script.exists():
                 activation_script.unlink()
                 print("🗑️  Ward Shell activation script removed")
@@ -504,303 +1006,123 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
 
     def handle_process_command(self, args) -> int:
         """Handle natural language command processing with JSON output"""
-        result = self.process_natural_command(args.command)
+        result = self.process_natural_command(args.text)
 
         # Output as JSON for programmatic use
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        print(_dumps_json(result))
         return 0
 
     def process_natural_command(self, user_input: str) -> Dict[str, Any]:
         """Process natural language command based on current mode"""
-        if self.ward_shell_mode:
-            # Ward Shell mode - use AI assistant
-            return self.ai_manager.process_command_with_ai(user_input)
-        else:
-            # Normal terminal mode - use local processing with JSON output
-            result = self.ai_manager._local_command_processing(user_input)
-            # Add mode information
-            result["mode"] = "terminal"
-            result["processing"] = "local"
-            return result
+        return self._processor_fn(user_input)
 
-    def main(self) -> int:
-        """Main CLI entry point - simplified interface"""
-        parser = argparse.ArgumentParser(
-            prog="ward",
-            description="Ward Security System - AI-powered terminal protection"
-        )
-
-        # Read version from pyproject.toml
-        version = "2.0.3"  # Will be updated during build
-        try:
-            try:
-                import tomllib
-            except ImportError:
-                import tomli as tomllib
-
-            pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
-            if pyproject_path.exists():
-                with open(pyproject_path, "rb") as f:
-                    pyproject = tomllib.load(f)
-                    version = pyproject["project"]["version"]
-        except (ImportError, FileNotFoundError, KeyError):
-            pass
-
-        parser.add_argument(
-            "--version",
-            action="version",
-            version=f"Ward Security v{version}"
-        )
+    def _terminal_processing(self, user_input: str) -> Dict[str, Any]:
+        """Normal terminal mode - local processing tagged with mode information"""
+        result = self.ai_manager._local_command_processing(user_input)
+        result.update(_TERMINAL_MODE_INFO)
+        return result
 
-        parser.add_argument(
-            "--mcp",
-            action="store_true",
-            help="Run Ward as MCP server"
-        )
+    # Commands that take no arguments, mapped to their handler method names
+    _PLAIN_COMMANDS = {
+        "mcp-server": "run_mcp_server",
+        "mcp-status": "mcp_status",
+        "mcp-test": "mcp_test",
+        "configure-claude": "configure_claude",
+        "activate": "handle_activate_command",
+        "deactivate": "handle_deactivate_command",
+        "interactive": "handle_interactive_mode",
+        "status": "handle_status_command",
+        "validate": "handle_validate_command",
+    }
+
+    # Commands whose handler takes the parsed arguments
+    _ARGS_COMMANDS = {
+        "ai": "handle_ai_command",
+        "process": "handle_process_command",
+        "check": "handle_check_command",
+        "init": "handle_init_command",
+        "favorites": "handle_favorites_command",
+        "plant": "handle_plant_command",
+        "lock": "handle_lock_command",
+        "unlock": "handle_unlock_command",
+        "info": "handle_ward_info_command",
+        "add": "handle_add_command",
+        "search": "handle_search_command",
+        "bookmark": "handle_bookmark_command",
+        "recent": "handle_recent_command",
+    }
 
-        # Create subparsers for commands
-        subparsers = parser.add_subparsers(
-            dest="command",
-            title="Commands",
-            description="Available commands",
-            metavar="COMMAND"
-        )
+    def main(self) -> int:
+        """Main CLI entry point - simplified interface"""
+        parser = _build_parser()
+        args = parser.parse_args()
+        command = args.command
 
-        # Core commands
-        subparsers.add_parser("status", help="Show Ward system status")
-        subparsers.add_parser("validate", help="Validate security policies")
-
-        # Path analysis
-        check_parser = subparsers.add_parser("check", help="Check security policies for path")
-        check_parser.add_argument("path", nargs="?", default=".", help="Path to check (default: current directory)")
-
-        # Init command
-        init_parser = subparsers.add_parser("init", help="Initialize Ward in a directory")
-        init_parser.add_argument("path", nargs="?", default=".", help="Directory path to initialize (default: current directory)")
-        init_parser.add_argument("--description", help="Custom description for the Ward policy")
-
-        # MCP integration
-        subparsers.add_parser("mcp-status", help="Check MCP server status")
-        subparsers.add_parser("mcp-test", help="Test MCP server functionality")
-        subparsers.add_parser("configure-claude", help="Configure Claude Desktop integration")
-
-        # Favorites management
-        fav_parser = subparsers.add_parser("favorites", help="Manage favorites")
-        fav_subparsers = fav_parser.add_subparsers(dest="fav_action")
-
-        fav_list = fav_subparsers.add_parser("list", help="List favorites")
-        fav_add = fav_subparsers.add_parser("add", help="Add to favorites")
-        fav_add.add_argument("path", help="Path to add")
-        fav_add.add_argument("description", nargs="*", help="Description")
-        fav_comment = fav_subparsers.add_parser("comment", help="Add comment")
-        fav_comment.add_argument("path", help="Path to comment on")
-        fav_comment.add_argument("comment", help="Comment text")
-        fav_comment.add_argument("author", nargs="?", default="CLI User", help="Comment author")
-
-        # Ward management
-        plant_parser = subparsers.add_parser("plant", help="Plant a Ward (protection)")
-        plant_parser.add_argument("path", nargs="?", default=".", help="Path to protect (defaults to current directory)")
-        plant_parser.add_argument("description", nargs="*", help="Description (optional - if not provided, creates description-only Ward with all permissions)")
-
-        lock_parser = subparsers.add_parser("lock", help="Lock directory with restriction message")
-        lock_parser.add_argument("message", help="Lock restriction message")
-        lock_parser.add_argument("path", nargs="?", default=".", help="Path to lock (defaults to current directory)")
-
-        unlock_parser = subparsers.add_parser("unlock", help="Unlock directory with permission message")
-        unlock_parser.add_argument("message", help="Unlock permission message")
-        unlock_parser.add_argument("path", nargs="?", default=".", help="Path to unlock (defaults to current directory)")
-
-        info_parser = subparsers.add_parser("info", help="Get Ward information")
-        info_parser.add_argument("path", help="Path to check")
-
-        # Add command with subcommands
-        add_parser = subparsers.add_parser("add", help="Add various items to Ward")
-        add_subparsers = add_parser.add_subparsers(dest="add_action")
-
-        add_comment_parser = add_subparsers.add_parser("comment", help="Add comment to current directory")
-        add_comment_parser.add_argument("comment", help="Comment text")
-        add_comment_parser.add_argument("path", nargs="?", default=".", help="Path to comment on (defaults to current directory)")
-
-        # Search and bookmarks
-        search_parser = subparsers.add_parser("search", help="Search through indexed folders")
-        search_parser.add_argument("query", help="Search query")
-        search_parser.add_argument("--in", choices=["all", "name", "files", "directories", "types"], default="all", help="Search scope")
-        search_parser.add_argument("--limit", type=int, default=20, help="Result limit")
-
-        bookmark_parser = subparsers.add_parser("bookmark", help="Manage bookmarks")
-        bookmark_subparsers = bookmark_parser.add_subparsers(dest="bookmark_action")
-
-        bookmark_add = bookmark_subparsers.add_parser("add", help="Add bookmark")
-        bookmark_add.add_argument("path", help="Path to bookmark")
-        bookmark_add.add_argument("--category", default="default", help="Bookmark category")
-        bookmark_add.add_argument("--name", help="Bookmark name")
-        bookmark_add.add_argument("--desc", help="Description")
-        bookmark_add.add_argument("--tags", help="Comma-separated tags")
-
-        bookmark_list = bookmark_subparsers.add_parser("list", help="List bookmarks")
-        bookmark_list.add_argument("--category", help="Filter by category")
-        bookmark_list.add_argument("--tags", help="Filter by tags")
-
-        recent_parser = subparsers.add_parser("recent", help="Show recent access")
-        recent_parser.add_argument("--hours", type=int, default=24, help="Hours to look back")
-        recent_parser.add_argument("--limit", type=int, default=20, help="Result limit")
-
-        # MCP server command
-        subparsers.add_parser("mcp-server", help="Run Ward as MCP server")
-
-        # AI Assistant commands
-        ai_parser = subparsers.add_parser("ai", help="Manage AI assistants")
-        ai_subparsers = ai_parser.add_subparsers(dest="ai_action")
-
-        ai_list_parser = ai_subparsers.add_parser("list", help="List available AI assistants")
-        ai_select_parser = ai_subparsers.add_parser("select", help="Select AI assistant")
-        ai_select_parser.add_argument("assistant_name", help="Name of assistant to select")
-
-        # Environment activation (new mode system)
-        activate_parser = subparsers.add_parser("activate", help="Activate Ward Shell mode (AI-assisted)")
-        deactivate_parser = subparsers.add_parser("deactivate", help="Deactivate Ward Shell mode (normal terminal)")
-
-        # Natural language processing
-        process_parser = subparsers.add_parser("process", help="Process natural language command (JSON output)")
-        process_parser.add_argument("command", help="Natural language command to process")
-
-        # Interactive mode
-        subparsers.add_parser("interactive", help="Start interactive Ward management mode")
-
-        # Help and version
-        subparsers.add_parser("help", help="Show this help message")
+        handler = self._PLAIN_COMMANDS.get(command)
+        if handler is not None:
+            return getattr(self, handler)()
 
-        args = parser.parse_args()
+        handler = self._ARGS_COMMANDS.get(command)
+        if handler is not None:
+            return getattr(self, handler)(args)
 
-        # Handle commands
-        if args.command == "mcp-server":
-            return self.run_mcp_server()
-        elif args.command == "ai":
-            return self.handle_ai_command(args)
-        elif args.command == "activate":
-            return self.handle_activate_command()
-        elif args.command == "deactivate":
-            return self.handle_deactivate_command()
-        elif args.command == "process":
-            return self.handle_process_command(args)
-        elif args.command == "interactive":
-            return self.handle_interactive_mode()
-        elif args.command is None:
+        if command is None:
             # Default to interactive mode when no command provided
             return self.handle_interactive_mode()
-        elif args.command == "status":
-            return self.handle_status_command()
-        elif args.command == "validate":
-            return self.handle_validate_command()
-        elif args.command == "check":
-            return self.handle_check_command(args)
-        elif args.command == "init":
-            return self.handle_init_command(args)
-        elif args.command == "mcp-status":
-            return self.mcp_status()
-        elif args.command == "mcp-test":
-            return self.mcp_test()
-        elif args.command == "configure-claude":
-            return self.configure_claude()
-        elif args.command == "favorites":
-            return self.handle_favorites_command(args)
-        elif args.command == "plant":
-            return self.handle_plant_command(args)
-        elif args.command == "lock":
-            return self.handle_lock_command(args)
-        elif args.command == "unlock":
-            return self.handle_unlock_command(args)
-        elif args.command == "info":
-            return self.handle_ward_info_command(args)
-        elif args.command == "add":
-            return self.handle_add_command(args)
-        elif args.command == "search":
-            return self.handle_search_command(args)
-        elif args.command == "bookmark":
-            return self.handle_bookmark_command(args)
-        elif args.command == "recent":
-            return self.handle_recent_command(args)
-        elif args.command == "help":
+        elif command == "help":
             parser.print_help()
             return 0
         else:
             # Fallback to bash CLI for unknown commands
-            return self.run_ward_command([args.command] if args.command else [])
+            return self.run_ward_command([command])
+
+    @property
+    def mcp_location(self) -> Optional[Path]:
+        """First existing MCP server location (probed once per process)"""
+        if self._mcp_location is _UNSET:
+            self._mcp_location = next((path for path in _MCP_PATHS if path.exists()), None)
+        return self._mcp_location
+
+    def _report_mcp_not_found(self) -> int:
+        """Print the checked MCP server locations"""
+        print("❌ MCP server not found")
+        print("Checked locations:")
+        for mcp_path in _MCP_PATHS:
+            print(f"  • {mcp_path}")
+        return 1
 
     def mcp_status(self) -> int:
         """Check MCP server status"""
         print("🤖 Ward MCP Server Status")
-        print("=" * 30)
+        print(_RULE_30)
 
-        # Check multiple potential MCP server locations
-        mcp_paths = [
-            self.mcp_server_path,  # ~/.ward/mcp/mcp_server.py
-            Path.home() / ".local/share/uv/tools/ward-security/lib/python3.11/site-packages/ward_security/mcp_server.py",
-            Path(__file__).parent / "mcp_server.py",  # Same directory as CLI
-        ]
-
-        mcp_found = False
-        mcp_location = None
-
-        for mcp_path in mcp_paths:
-            if mcp_path.exists():
-                mcp_found = True
-                mcp_location = mcp_path
-                break
-
-        if not mcp_found:
-            print("❌ MCP server not found")
-            print("Checked locations:")
-            for mcp_path in mcp_paths:
-                print(f"  • {mcp_path}")
-            return 1
+        mcp_location = self.mcp_location
+        if mcp_location is None:
+            return self._report_mcp_not_found()
 
         try:
-            # Test if MCP server can be imported
-            import subprocess
-
-            # Test if the MCP server file exists and can be executed as Python
-            if mcp_location.name == "mcp_server.py":
-                # Test basic Python syntax by trying to compile the file
-                result = subprocess.run(
-                    [sys.executable, "-m", "py_compile", str(mcp_location)],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-
-                if result.returncode == 0:
-                    print("✅ MCP server file is valid Python")
-                else:
-                    print("❌ MCP server file has syntax errors")
-                    print("Error:", result.stderr)
-                    return 1
-            else:
-                # Test direct import from the found location
-                result = subprocess.run(
-                    [sys.executable, "-c", f"import sys; sys.path.insert(0, '{mcp_location.parent}'); from ward_security.mcp_server import app; print('✅ MCP server can be imported')"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-
-            if result.returncode == 0:
-                print("✅ MCP server is properly configured")
-                print(f"📍 Location: {mcp_location}")
-                print("🚀 Ready for AI assistant integration")
+            # Every _MCP_PATHS entry is an mcp_server.py file, so a syntax
+            # check is all there is to do; compile in-process for it
+            try:
+                compile(mcp_location.read_bytes(), str(mcp_location), "exec")
+            except SyntaxError as e:
+                print("❌ MCP server file has syntax errors")
+                print("Error:", e)
+                return 1
+            print("✅ MCP server file is valid Python")
 
-                # Check if MCP dependencies are available
-                try:
-                    import mcp
-                    print("✅ MCP library available")
-                except ImportError:
-                    print("⚠️  MCP library not found - install with: pip install mcp")
+            print("✅ MCP server is properly configured")
+            print(f"📍 Location: {mcp_location}")
+            print("🚀 Ready for AI assistant integration")
 
-                return 0
-            else:
-                print("❌ MCP server configuration error")
-                print("Error:", result.stderr)
-                return 1
+            # Check if MCP dependencies are available
+            try:
+                import mcp
+                print("✅ MCP library available")
+            except ImportError:
+                print("⚠️  MCP library not found - install with: pip install mcp")
+
+            return 0
 
         except Exception as e:
             print(f"❌ Error checking MCP server: {e}")
@@ -810,66 +1132,90 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
         """Configure Claude Desktop for Ward integration"""
         configure_script = self.ward_root / "configure-claude-desktop.sh"
 
-        if not configure_script.exists():
+        try:
+            st = configure_script.stat()
+        except FileNotFoundError:
             print("❌ Claude Desktop configuration script not found")
             return 1
 
         try:
-            os.chmod(config_script, 0o755)
-            result = subprocess.run([str(config_script)], cwd=self.ward_root)
+            # One stat covers both the existence check and the mode check
+            if (st.st_mode & 0o111) != 0o111:
+                configure_script.chmod(st.st_mode | 0o755)
+            result = subprocess.run([str(configure_script)], cwd=self.ward_root)
             return result.returncode
         except Exception as e:
             print(f"❌ Error configuring Claude Desktop: {e}")
             return 1
 
+    def _mcp_request(self, location: Path, message: bytes) -> Tuple[bytes, bytes]:
+        """Send one JSON-RPC line to a fresh MCP server and return (stdout, stderr)
+
+        Output is collected until stdout holds a complete reply line or the
+        server exits; the whole exchange is bounded by _MCP_TEST_TIMEOUT.
+        """
+        deadline = time.monotonic() + _MCP_TEST_TIMEOUT
+        proc = subprocess.Popen(
+            [sys.executable, str(location)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        stdout = bytearray()
+        stderr = bytearray()
+        # Both pipes are drained so a chatty server never blocks on stderr
+        pending = {proc.stdout.fileno(): stdout, proc.stderr.fileno(): stderr}
+        try:
+            try:
+                proc.stdin.write(message)
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass  # Server already exited; whatever it printed is still readable
+
+            while pending and b"\n" not in stdout:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(proc.args, _MCP_TEST_TIMEOUT)
+                ready, _, _ = select.select(list(pending), [], [], remaining)
+                for fd in ready:
+                    chunk = os.read(fd, 65536)
+                    if chunk:
+                        pending[fd] += chunk
+                    else:
+                        del pending[fd]
+        finally:
+            proc.kill()
+            proc.wait()
+            proc.stdout.close()
+            proc.stderr.close()
+        return bytes(stdout), bytes(stderr)
+
     def mcp_test(self) -> int:
         """Test MCP server functionality"""
         print("🧪 Testing Ward MCP Server")
-        print("=" * 30)
-
-        # Check multiple potential MCP server locations (same logic as mcp_status)
-        mcp_paths = [
-            self.mcp_server_path,  # ~/.ward/mcp/mcp_server.py
-            Path.home() / ".local/share/uv/tools/ward-security/lib/python3.11/site-packages/ward_security/mcp_server.py",
-            Path(__file__).parent / "mcp_server.py",  # Same directory as CLI
-        ]
+        print(_RULE_30)
 
-        mcp_found = False
-        mcp_location = None
-
-        for mcp_path in mcp_paths:
-            if mcp_path.exists():
-                mcp_found = True
-                mcp_location = mcp_path
-                break
-
-        if not mcp_found:
-            print("❌ MCP server not found")
-            print("Checked locations:")
-            for mcp_path in mcp_paths:
-                print(f"  • {mcp_path}")
-            return 1
+        mcp_location = self.mcp_location
+        if mcp_location is None:
+            return self._report_mcp_not_found()
 
         try:
             # Test basic MCP server functionality
-            result = subprocess.run(
-                [sys.executable, str(mcp_location)],
-                input='{"jsonrpc": "2.0", "id": 1, "method": "initialize"}\n',
-                capture_output=True,
-                text=True,
-                timeout=10
+            reply, stderr = self._mcp_request(
+                mcp_location,
+                b'{"jsonrpc": "2.0", "id": 1, "method": "initialize"}\n'
             )
 
-            if "result" in result.stdout or "error" in result.stdout:
+            if b"result" in reply or b"error" in reply:
                 print("✅ MCP server is responding correctly")
                 print("🔧 Ready for AI assistant integration")
                 print(f"📍 Location: {mcp_location}")
                 return 0
             else:
                 print("❌ MCP server not responding properly")
-                print("Output:", result.stdout)
-                if result.stderr:
-                    print("Error:", result.stderr)
+                print("Output:", _decode_output(reply))
+                if stderr:
+                    print("Error:", _decode_output(stderr))
                 return 1
 
         except subprocess.TimeoutExpired:
@@ -879,53 +1225,6 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
             print(f"❌ Error testing MCP server: {e}")
             return 1
 
-    def handle_favorites(self, args: List[str]) -> int:
-        """Handle favorites commands"""
-        if not args:
-            return self.favorites_list()
-
-        command = args[0]
-        if command == "list":
-            return self.favorites_list()
-        elif command == "add":
-            if len(args) < 2:
-                print("Usage: ward favorites add <path> [description]", file=sys.stderr)
-                return 1
-            path = args[1]
-            description = " ".join(args[2:]) if len(args) > 2 else ""
-            return self.favorites_add(path, description)
-        elif command == "comment":
-            if len(args) < 3:
-                print("Usage: ward favorites comment <path> <comment> [author]", file=sys.stderr)
-                return 1
-            path = args[1]
-            comment = args[2]
-            author = args[3] if len(args) > 3 else "CLI User"
-            return self.favorites_comment(path, comment, author)
-        else:
-            print(f"Unknown favorites command: {command}", file=sys.stderr)
-            print("Available commands: list, add, comment", file=sys.stderr)
-            return 1
-
-    def handle_plant_ward(self, args: List[str]) -> int:
-        """Handle ward planting command"""
-        if not args:
-            print("Usage: ward plant-ward <path> [description]", file=sys.stderr)
-            return 1
-
-        path = args[0]
-        description = " ".join(args[1:]) if len(args) > 1 else ""
-        return self.plant_ward_cli(path, description)
-
-    def handle_ward_info(self, args: List[str]) -> int:
-        """Handle ward info command"""
-        if not args:
-            print("Usage: ward ward-info <path>", file=sys.stderr)
-            return 1
-
-        path = args[0]
-        return self.ward_info_cli(path)
-
     def favorites_list(self) -> int:
         """List all favorites"""
         favorites = self.favorites.get_favorites()
@@ -934,28 +1233,29 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
             print("📋 No favorites found. Use 'ward favorites add <path>' to add Ward-protected directories.")
             return 0
 
-        print("📋 Ward Favorites:")
-        print("=" * 50)
-        print()
+        # Buffer the listing and emit it with a single write
+        out = ["📋 Ward Favorites:", _RULE_50, ""]
 
         for i, fav in enumerate(favorites, 1):
-            status = "🛡️ Protected" if fav["ward_status"]["protected"] else "❌ Unprotected"
-            exists = "✅" if fav["exists"] else "❌"
-
-            print(f"{i}. {fav['path']} {exists}")
-            print(f"   📝 Description: {fav['description'] or 'No description'}")
-            print(f"   🛡️ Status: {status}")
-            print(f"   📅 Added: {fav['added_date'][:10]}")
-            print(f"   🔄 Access count: {fav['access_count']}")
+            out.append(_FAVORITE_TEMPLATE.format_map({
+                "i": i,
+                "path": fav["path"],
+                "exists": "✅" if fav["exists"] else "❌",
+                "description": fav["description"] or "No description",
+                "status": "🛡️ Protected" if fav["ward_status"]["protected"] else "❌ Unprotected",
+                "added": fav["added_date"][:10],
+                "access_count": fav["access_count"],
+            }))
 
             if fav["recent_comments"]:
-                print("   💬 Recent comments:")
-                for comment in fav["recent_comments"]:
-                    truncated = comment['comment'][:50] + ('...' if len(comment['comment']) > 50 else '')
-                    print(f"      • {comment['author']}: {truncated}")
+                out.append("   💬 Recent comments:\n" + "\n".join(
+                    f"      • {c['author']}: {_shorten(c['comment'], 50)}"
+                    for c in fav["recent_comments"]
+                ))
 
-            print()
+            out.append("")
 
+        sys.stdout.write("\n".join(out) + "\n")
         return 0
 
     def favorites_add(self, path: str, description: str) -> int:
@@ -987,54 +1287,54 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
             print(f"❌ Failed to add comment: {result['error']}", file=sys.stderr)
             return 1
 
-    def plant_ward_cli(self, path: str, description: str) -> int:
+    def plant_ward_cli(self, path: str, description: str, resolved: Optional[Path] = None) -> int:
         """Plant a Ward via CLI"""
-        result = self.planter.plant_ward(path, description, False)  # CLI initiated, not AI
+        result = self.planter.plant_ward(path, description, False, resolved)  # CLI initiated, not AI
 
         if result["success"]:
-            print(f"✅ Ward planted successfully!")
-            print()
-            print(f"📍 Location: {result['ward_file']}")
-            print(f"🔐 Password file: {result['password_file']}")
-            print()
-            print("⚠️ IMPORTANT SECURITY NOTICE:")
-            print("• A password has been generated and stored for security")
-            print("• To modify/remove this Ward, manually edit the password file")
-            print("• The password file location is provided for manual user intervention")
+            sys.stdout.write(
+                "✅ Ward planted successfully!\n\n"
+                f"📍 Location: {result['ward_file']}\n"
+                f"🔐 Password file: {result['password_file']}\n\n"
+                + _PLANT_NOTICE
+            )
             return 0
         else:
             print(f"❌ Failed to plant Ward: {result['error']}", file=sys.stderr)
             return 1
 
-    def ward_info_cli(self, path: str) -> int:
+    def ward_info_cli(self, path: str, resolved: Optional[Path] = None) -> int:
         """Get Ward info via CLI"""
-        info = self.planter.get_ward_info(path)
+        info = self.planter.get_ward_info(path, resolved)
 
         if not info["protected"]:
             print(f"❌ No Ward found at: {path}")
             return 1
 
-        print(f"🛡️ Ward Information for: {path}")
-        print("=" * 50)
-        print()
-        print(f"📁 Ward file: {info['ward_file']}")
-        print(f"🔐 Password protected: {'Yes' if info['password_protected'] else 'No'}")
+        out = [
+            f"🛡️ Ward Information for: {path}",
+            _RULE_50,
+            "",
+            f"📁 Ward file: {info['ward_file']}",
+            f"🔐 Password protected: {'Yes' if info['password_protected'] else 'No'}",
+        ]
 
         if info["password_protected"]:
-            print(f"🗝️ Password file: {info['password_file']}")
-            print()
-            print("⚠️ WARNING: This Ward is password-protected.")
-            print("Manual user intervention required for removal.")
+            out.append(f"🗝️ Password file: {info['password_file']}")
+            out.append("")
+            out.append("⚠️ WARNING: This Ward is password-protected.")
+            out.append("Manual user intervention required for removal.")
 
         if info.get("readable"):
-            print()
-            print("📄 Ward Policy Content:")
-            print("-" * 30)
-            print(info.get("content", "Unable to read content"))
+            out.append("")
+            out.append("📄 Ward Policy Content:")
+            out.append(_DASH_30)
+            out.append(info.get("content", "Unable to read content"))
         else:
-            print()
-            print("❌ Ward policy file is not readable (permissions issue)")
+            out.append("")
+            out.append("❌ Ward policy file is not readable (permissions issue)")
 
+        sys.stdout.write("\n".join(out) + "\n")
         return 0
 
     def handle_favorites_command(self, args) -> int:
@@ -1042,8 +1342,7 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
         if args.fav_action == "list" or args.fav_action is None:
             return self.favorites_list()
         elif args.fav_action == "add":
-            description = " ".join(args.description) if args.description else ""
-            return self.favorites_add(args.path, description)
+            return self.favorites_add(args.path, args.description)
         elif args.fav_action == "comment":
             return self.favorites_comment(args.path, args.comment, args.author)
         else:
@@ -1053,19 +1352,21 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
     def handle_plant_command(self, args) -> int:
         """Handle plant command"""
         if args.description:
-            description = " ".join(args.description)
+            description = args.description
         else:
             # No description provided - create a default description-only Ward
             description = f"이 폴더는 건드리면 안된다"
 
-        result = self.plant_ward_cli(args.path, description)
+        # Resolved once for both the plant and the info display
+        resolved = Path(args.path).resolve()
+        result = self.plant_ward_cli(args.path, description, resolved)
 
         # Show planted result after successful planting
         if result == 0:
             print()
             print("🌱 **심어진 결과 (Planted Result):**")
-            print("=" * 50)
-            self.ward_info_cli(args.path)
+            print(_RULE_50)
+            self.ward_info_cli(args.path, resolved)
 
         return result
 
@@ -1080,7 +1381,8 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
 
         # Create a restrictive Ward configuration
         lock_description = f"🔒 LOCKED: {args.message}"
-        result = self.plant_ward_cli(args.path, lock_description)
+        resolved = Path(args.path).resolve()
+        result = self.plant_ward_cli(args.path, lock_description, resolved)
 
         if result == 0:
             print()
@@ -1089,8 +1391,8 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
             print(f"🔒 Restriction: {args.message}")
             print()
             print("🛡️ Lock Status:")
-            print("=" * 40)
-            self.ward_info_cli(args.path)
+            print(_RULE_40)
+            self.ward_info_cli(args.path, resolved)
 
         return result
 
@@ -1101,7 +1403,8 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
 
         # Create a permissive Ward configuration
         unlock_description = f"🔓 UNLOCKED: {args.message}"
-        result = self.plant_ward_cli(args.path, unlock_description)
+        resolved = Path(args.path).resolve()
+        result = self.plant_ward_cli(args.path, unlock_description, resolved)
 
         if result == 0:
             print()
@@ -1110,8 +1413,8 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
             print(f"🔓 Permission: {args.message}")
             print()
             print("🛡️ Unlock Status:")
-            print("=" * 40)
-            self.ward_info_cli(args.path)
+            print(_RULE_40)
+            self.ward_info_cli(args.path, resolved)
 
         return result
 
@@ -1124,11 +1427,7 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
             # For now, create a simple comment file (can be enhanced later)
             comment_file = Path(args.path) / ".ward_comment.txt"
             try:
-                with open(comment_file, 'w', encoding='utf-8') as f:
-                    f.write(f"💬 Comment: {args.comment}\n")
-                    f.write(f"📅 Added: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write(f"👤 By: CLI User\n")
-
+                _write_comment_file(comment_file, args.comment, "CLI User")
                 print("✅ Comment added successfully!")
                 print(f"📍 Location: {comment_file}")
                 print(f"📝 Content: {args.comment}")
@@ -1155,11 +1454,9 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
     def handle_bookmark_command(self, args) -> int:
         """Handle bookmark command"""
         if args.bookmark_action == "add":
-            tags = [tag.strip() for tag in args.tags.split(",")] if args.tags else []
-            return self.add_bookmark(args.path, args.category, args.name, args.desc or "", tags)
+            return self.add_bookmark(args.path, args.category, args.name, args.desc or "", args.tags)
         elif args.bookmark_action == "list":
-            tags = [tag.strip() for tag in args.tags.split(",")] if args.tags else []
-            return self.list_bookmarks(args.category or "", tags)
+            return self.list_bookmarks(args.category or "", args.tags)
         elif args.bookmark_action is None:
             # No subcommand provided - show usage
             print("Usage: ward bookmark <subcommand> [options]")
@@ -1176,142 +1473,34 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
         """Handle recent command"""
         return self.show_recent(args.hours, args.limit)
 
-    def handle_search(self, args: List[str]) -> int:
-        """Handle search command"""
-        if not args:
-            print("Usage: ward search <query> [--in all|name|files|directories|types] [--limit N]", file=sys.stderr)
-            return 1
-
-        query = args[0]
-        search_in = "all"
-        limit = 20
-
-        # Parse optional arguments
-        i = 1
-        while i < len(args):
-            if args[i] == "--in" and i + 1 < len(args):
-                search_in = args[i + 1]
-                i += 2
-            elif args[i] == "--limit" and i + 1 < len(args):
-                try:
-                    limit = int(args[i + 1])
-                except ValueError:
-                    print("Error: --limit must be a number", file=sys.stderr)
-                    return 1
-                i += 2
-            else:
-                i += 1
-
-        return self.search_folders(query, search_in, limit)
-
-    def handle_bookmark(self, args: List[str]) -> int:
-        """Handle bookmark command"""
-        if not args:
-            return self.list_bookmarks("", [])
-
-        command = args[0]
-        if command == "add":
-            if len(args) < 2:
-                print("Usage: ward bookmark add <path> [--category CAT] [--name NAME] [--desc DESC] [--tags TAG1,TAG2]", file=sys.stderr)
-                return 1
-
-            path = args[1]
-            category = "default"
-            name = None
-            description = ""
-            tags = []
-
-            # Parse optional arguments
-            i = 2
-            while i < len(args):
-                if args[i] == "--category" and i + 1 < len(args):
-                    category = args[i + 1]
-                    i += 2
-                elif args[i] == "--name" and i + 1 < len(args):
-                    name = args[i + 1]
-                    i += 2
-                elif args[i] == "--desc" and i + 1 < len(args):
-                    description = args[i + 1]
-                    i += 2
-                elif args[i] == "--tags" and i + 1 < len(args):
-                    tags = [tag.strip() for tag in args[i + 1].split(",")]
-                    i += 2
-                else:
-                    i += 1
-
-            return self.add_bookmark(path, category, name, description, tags)
-
-        elif command == "list":
-            category = None
-            tags = []
-
-            # Parse optional arguments
-            i = 1
-            while i < len(args):
-                if args[i] == "--category" and i + 1 < len(args):
-                    category = args[i + 1]
-                    i += 2
-                elif args[i] == "--tags" and i + 1 < len(args):
-                    tags = [tag.strip() for tag in args[i + 1].split(",")]
-                    i += 2
-                else:
-                    i += 1
-
-            return self.list_bookmarks(category, tags)
-
-        else:
-            print(f"Unknown bookmark command: {command}", file=sys.stderr)
-            print("Available commands: add, list", file=sys.stderr)
-            return 1
-
-    def handle_recent(self, args: List[str]) -> int:
-        """Handle recent command"""
-        hours = 24
-        limit = 20
-
-        # Parse optional arguments
-        i = 0
-        while i < len(args):
-            if args[i] == "--hours" and i + 1 < len(args):
-                try:
-                    hours = int(args[i + 1])
-                except ValueError:
-                    print("Error: --hours must be a number", file=sys.stderr)
-                    return 1
-                i += 2
-            elif args[i] == "--limit" and i + 1 < len(args):
-                try:
-                    limit = int(args[i + 1])
-                except ValueError:
-                    print("Error: --limit must be a number", file=sys.stderr)
-                    return 1
-                i += 2
-            else:
-                i += 1
-
-        return self.show_recent(hours, limit)
-
     def search_folders(self, query: str, search_in: str, limit: int) -> int:
         """Search through indexed folders"""
         result = self.indexer.search_folders(query, search_in, limit)
 
         if result["success"]:
-            print(f"🔍 Search Results for '{result['query']}' (in {result['search_in']}):")
-            print(f"Found {result['total_results']} results")
-            print("=" * 50)
-            print()
+            out = [
+                f"🔍 Search Results for '{result['query']}' (in {result['search_in']}):",
+                f"Found {result['total_results']} results",
+                _RULE_50,
+                "",
+            ]
 
             for i, match in enumerate(result["results"], 1):
-                print(f"{i}. 📁 {match['path']} (Score: {match['score']})")
-                print(f"   📊 {match['total_files']} files, {match['total_dirs']} directories")
-                print(f"   💾 Size: {match['total_size']:,} bytes")
-                print(f"   🔍 Matches: {', '.join(match['matches'][:3])}", end="")
-                if len(match['matches']) > 3:
-                    print(f" (+{len(match['matches'])-3} more)")
-                else:
-                    print()
-                print()
-
+                matches = ", ".join(match["matches"][:3])
+                if len(match["matches"]) > 3:
+                    matches += f" (+{len(match['matches'])-3} more)"
+                out.append(_SEARCH_RESULT_TEMPLATE.format_map({
+                    "i": i,
+                    "path": match["path"],
+                    "score": match["score"],
+                    "total_files": match["total_files"],
+                    "total_dirs": match["total_dirs"],
+                    "total_size": match["total_size"],
+                    "matches": matches,
+                }))
+                out.append("")
+
+            sys.stdout.write("\n".join(out) + "\n")
             return 0
         else:
             print(f"❌ Search failed: {result.get('error', 'Unknown error')}", file=sys.stderr)
@@ -1351,31 +1540,30 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
             print(f"📋 No bookmarks found{filter_text}. Use 'ward bookmark add' to add bookmarks.")
             return 0
 
-        print("📋 Ward Bookmarks:")
-        print("=" * 50)
-        print()
+        out = ["📋 Ward Bookmarks:", _RULE_50, ""]
 
         # Group by category
-        categories = {}
+        categories = defaultdict(list)
         for bookmark in bookmarks:
-            cat = bookmark["category"]
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(bookmark)
+            categories[bookmark["category"]].append(bookmark)
 
-        for category, cat_bookmarks in categories.items():
-            print(f"📂 {category.upper()} ({len(cat_bookmarks)} bookmarks)")
-            print("-" * 30)
+        for category, cat_bookmarks in sorted(categories.items()):
+            out.append(f"📂 {category.upper()} ({len(cat_bookmarks)} bookmarks)")
+            out.append(_DASH_30)
 
             for i, bookmark in enumerate(cat_bookmarks, 1):
-                print(f"  {i}. 📁 {bookmark['name']}")
-                print(f"     📍 {bookmark['path']}")
-                print(f"     🏷️ Tags: {', '.join(bookmark['tags']) if bookmark['tags'] else 'None'}")
-                print(f"     🔄 Access count: {bookmark['access_count']}")
+                out.append(_BOOKMARK_TEMPLATE.format_map({
+                    "i": i,
+                    "name": bookmark["name"],
+                    "path": bookmark["path"],
+                    "tags": ", ".join(bookmark["tags"]) if bookmark["tags"] else "None",
+                    "access_count": bookmark["access_count"],
+                }))
                 if bookmark['description']:
-                    print(f"     📝 {bookmark['description']}")
-                print()
+                    out.append(f"     📝 {bookmark['description']}")
+                out.append("")
 
+        sys.stdout.write("\n".join(out) + "\n")
         return 0
 
     def show_recent(self, hours: int, limit: int) -> int:
@@ -1386,28 +1574,26 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
             print(f"📋 No recent access found in the last {hours} hours.")
             return 0
 
-        print(f"📋 Recent Access (last {hours} hours):")
-        print("=" * 50)
-        print()
+        out = [f"📋 Recent Access (last {hours} hours):", _RULE_50, ""]
 
-        from datetime import datetime
         for i, entry in enumerate(recent_access, 1):
-            timestamp = datetime.fromisoformat(entry["timestamp"])
-            time_str = timestamp.strftime("%Y-%m-%d %H:%M:%S")
+            time_str = _format_timestamp(entry["timestamp"])
 
-            print(f"{i}. 📁 {entry['folder_name']}")
-            print(f"   📍 {entry['path']}")
-            print(f"   ⏰ {time_str}")
-            print(f"   🔧 Action: {entry['action']}")
-            print()
+            out.append(
+                f"{i}. 📁 {entry['folder_name']}\n"
+                f"   📍 {entry['path']}\n"
+                f"   ⏰ {time_str}\n"
+                f"   🔧 Action: {entry['action']}\n"
+            )
 
+        sys.stdout.write("\n".join(out) + "\n")
         return 0
 
   
     def handle_status_command(self) -> int:
         """Handle status command"""
         print("🔍 Ward Security System Status")
-        print("=" * 30)
+        print(_RULE_30)
 
         # Check if current directory has .ward file
         current_dir = Path.cwd()
@@ -1419,12 +1605,9 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
 
             # Read and display basic policy info
             try:
-                with open(ward_file, 'r') as f:
-                    content = f.read()
-                    for line in content.split('\n'):
-                        if line.startswith('@description:'):
-                            print(f"📝 {line}")
-                            break
+                description = _read_ward_description(ward_file)
+                if description:
+                    print(f"📝 {description}")
             except Exception:
                 pass
         else:
@@ -1436,7 +1619,7 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
     def handle_validate_command(self) -> int:
         """Handle validate command"""
         print("🔒 Validating Ward Security Policies")
-        print("=" * 35)
+        print(_RULE_35)
 
         current_dir = Path.cwd()
         ward_file = current_dir / ".ward"
@@ -1447,18 +1630,12 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
             return 1
 
         try:
-            with open(ward_file, 'r') as f:
-                content = f.read()
+            summary = _read_ward_summary(ward_file)
 
-            if '@whitelist:' in content and '@blacklist:' in content:
+            if summary["has_whitelist"] and summary["has_blacklist"]:
                 print("✅ Policy structure is valid")
-
-                # Count rules
-                whitelist_count = content.count('@whitelist:')
-                blacklist_count = content.count('@blacklist:')
-
-                print(f"📋 Whitelist rules: {whitelist_count}")
-                print(f"🚫 Blacklist rules: {blacklist_count}")
+                print(f"📋 Whitelist rules: {summary['whitelist_count']}")
+                print(f"🚫 Blacklist rules: {summary['blacklist_count']}")
 
             else:
                 print("⚠️  Incomplete policy - missing whitelist or blacklist")
@@ -1472,7 +1649,7 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
 
     def handle_check_command(self, args) -> int:
         """Handle check command"""
-        target_path = Path(args.path).resolve()
+        target_path = Path(os.path.abspath(args.path))
         ward_file = target_path / ".ward"
 
         if not ward_file.exists():
@@ -1486,19 +1663,14 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
             return 1
 
         print(f"🔍 Checking Ward policies for: {args.path}")
-        print("=" * 40)
+        print(_RULE_40)
         print(f"✅ .ward policy found: {ward_file}")
 
         # Read and display policy summary
         try:
-            with open(ward_file, 'r') as f:
-                content = f.read()
-
-            if '@description:' in content:
-                for line in content.split('\n'):
-                    if line.startswith('@description:'):
-                        print(f"📝 {line}")
-                        break
+            description = _read_ward_description(ward_file)
+            if description:
+                print(f"📝 {description}")
 
             print("📋 Policy active - use specific commands for detailed analysis")
 
@@ -1512,17 +1684,17 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
         path = args.path or "."
 
         # Check for legacy installations and warn user
-        legacy_ward = Path.home() / ".ward"
-        local_bin_ward = Path.home() / ".local/bin" / "ward"
+        legacy_ward = _WARD_HOME
+        local_bin_ward = _LOCAL_BIN_WARD
 
-        if legacy_ward.exists():
+        if _exists_or_symlink(legacy_ward):
             print("⚠️  WARNING: Legacy Ward installation detected!")
             print(f"   Found at: {legacy_ward}")
             print("   This may cause conflicts with UV installation")
             print("   Consider removing with: rm -rf ~/.ward")
             print()
 
-        if local_bin_ward.exists() or local_bin_ward.is_symlink():
+        if _exists_or_symlink(local_bin_ward):
             print("⚠️  WARNING: Legacy Ward binary found!")
             print(f"   Found at: {local_bin_ward}")
             print("   This may cause conflicts with UV installation")
@@ -1530,7 +1702,7 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
             print()
 
         # Create directory if it doesn't exist
-        target_path = Path(path).resolve()
+        target_path = Path(os.path.abspath(path))
         target_path.mkdir(parents=True, exist_ok=True)
 
         # Check if .ward already exists
@@ -1539,20 +1711,12 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
             print(f"❌ .ward file already exists in {path}")
             return 1
 
-        # Create basic .ward file content
-        description = getattr(args, 'description', 'AI-Assisted Development Project')
-        ward_content = f"""# Ward Security Configuration
-@description: {description}
-@whitelist: ls cat pwd echo grep sed awk git python npm node code vim
-@blacklist: rm -rf / sudo su chmod chown docker kubectl
-@allow_comments: true
-@max_comments: 5
-@comment_prompt: "Explain changes from a security perspective"
-"""
+        # Only the description varies; the rest of the policy is pre-encoded
+        description = args.description or "AI-Assisted Development Project"
 
         # Write .ward file
-        with open(ward_file, 'w') as f:
-            f.write(ward_content)
+        with open(ward_file, 'wb') as f:
+            f.write(_WARD_INIT_PREFIX + description.encode("utf-8") + _WARD_INIT_SUFFIX)
 
         print(f"✅ Ward initialized in {path}")
         print(f"📁 Policy file: {ward_file}")
@@ -1563,6 +1727,15 @@ echo "🔧 Use 'ward deactivate' to return to normal terminal"
 
 def main() -> int:
     """Main entry point for the CLI"""
+    # Trivial invocations are answered without building WardCLI
+    argv = sys.argv[1:]
+    if argv == ["--version"]:
+        sys.stdout.write(f"Ward Security v{_package_version()}\n")
+        return 0
+    if argv in (["help"], ["-h"], ["--help"]):
+        _build_parser().print_help()
+        return 0
+
     cli = WardCLI()
     return cli.main()
 
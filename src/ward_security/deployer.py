@@ -4,65 +4,17 @@ Ward Security Deployer
 Deployment utilities for Ward Security System
 """
 
+import io
 import os
 import sys
-import shutil
 import subprocess
+import tarfile
+import time
 from pathlib import Path
 from typing import List, Optional
 
-class WardDeployer:
-    """Ward Security System Deployer"""
-
-    def __init__(self):
-        self.package_root = Path(__file__).parent.parent.parent
-        self.ward_dir = self.package_root / ".ward"
-
-    def create_deployment_package(self, target_dir: Path) -> bool:
-        """Create a deployment package"""
-        try:
-            # Create deployment directory structure
-            deploy_dir = target_dir / "ward-deployment"
-            deploy_dir.mkdir(exist_ok=True)
-
-            # Copy .ward directory
-            if self.ward_dir.exists():
-                shutil.copytree(self.ward_dir, deploy_dir / ".ward")
-
-            # Copy main scripts
-            scripts = ["setup-ward.sh", "ward-cli.sh", "ward-shell"]
-            for script in scripts:
-                source = self.package_root / script
-                if source.exists():
-                    shutil.copy2(source, deploy_dir)
-
-            # Copy documentation
-            for doc_file in ["README.md", "LICENSE", "CHANGELOG.md"]:
-                source = self.package_root / doc_file
-                if source.exists():
-                    shutil.copy2(source, deploy_dir)
-
-            # Create deployment manifest
-            manifest = {
-                "version": "2.0.0",
-                "created_by": "Ward Security Deployer",
-                "files": [
-                    ".ward/",
-                    "setup-ward.sh",
-                    "ward-cli.sh",
-                    "ward-shell",
-                    "README.md"
-                ]
-            }
-
-            import json
-            (deploy_dir / "manifest.json").write_text(
-                json.dumps(manifest, indent=2)
-            )
-
-            # Create deployment script
-            deploy_script = deploy_dir / "deploy.sh"
-            deploy_script.write_text("""#!/bin/bash
+# Entry point shipped inside every deployment package
+_DEPLOY_SCRIPT = """#!/bin/bash
 # Ward Security Deployment Script
 
 set -euo pipefail
@@ -85,15 +37,95 @@ else
     echo "Error: Ward CLI not found after installation"
     exit 1
 fi
-""")
-            deploy_script.chmod(0o755)
+"""
+
+
+def _unsafe_member(member: tarfile.TarInfo, root: str) -> Optional[str]:
+    """Why extracting member under root would be unsafe, or None if it is not
+
+    Used where tarfile has no 'data' filter; mirrors what GNU tar refuses
+    by default: absolute names, '..' components and links out of root.
+    """
+    name = member.name
+    if os.path.isabs(name) or ".." in Path(name).parts:
+        return f"unsafe path {name!r}"
+    if member.isdev():
+        return f"special file {name!r}"
+    if member.issym() or member.islnk():
+        if os.path.isabs(member.linkname):
+            return f"absolute link {name!r} -> {member.linkname!r}"
+        # Symlinks resolve from their own directory, hard links from the root
+        base = os.path.dirname(os.path.join(root, name)) if member.issym() else root
+        dest = os.path.normpath(os.path.join(base, member.linkname))
+        if os.path.commonpath([root, dest]) != root:
+            return f"link out of target {name!r} -> {member.linkname!r}"
+    return None
+
 
-            # Create archive
+class WardDeployer:
+    """Ward Security System Deployer"""
+
+    def __init__(self):
+        self.package_root = Path(__file__).parent.parent.parent
+        self.ward_dir = self.package_root / ".ward"
+
+    @staticmethod
+    def _add_bytes(tar: tarfile.TarFile, name: str, data: bytes, mode: int) -> None:
+        """Add an in-memory file to an open archive"""
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mode = mode
+        info.mtime = int(time.time())
+        tar.addfile(info, io.BytesIO(data))
+
+    def create_deployment_package(self, target_dir: Path) -> bool:
+        """Create a deployment package"""
+        try:
+            # Stream everything straight into the archive; nothing is staged on disk
             archive_name = f"ward-security-{target_dir.name}.tar.gz"
-            subprocess.run([
-                "tar", "-czf", str(target_dir / archive_name),
-                "-C", str(target_dir), "ward-deployment"
-            ], check=True)
+            with tarfile.open(target_dir / archive_name, "w:gz") as tar:
+                root = tarfile.TarInfo("ward-deployment")
+                root.type = tarfile.DIRTYPE
+                root.mode = 0o755
+                root.mtime = int(time.time())
+                tar.addfile(root)
+
+                # Add .ward policy
+                if self.ward_dir.exists():
+                    tar.add(self.ward_dir, arcname="ward-deployment/.ward")
+
+                # Add main scripts
+                scripts = ["setup-ward.sh", "ward-cli.sh", "ward-shell"]
+                for script in scripts:
+                    source = self.package_root / script
+                    if source.exists():
+                        tar.add(source, arcname=f"ward-deployment/{script}")
+
+                # Add documentation
+                for doc_file in ["README.md", "LICENSE", "CHANGELOG.md"]:
+                    source = self.package_root / doc_file
+                    if source.exists():
+                        tar.add(source, arcname=f"ward-deployment/{doc_file}")
+
+                # Create deployment manifest
+                manifest = {
+                    "version": "2.0.0",
+                    "created_by": "Ward Security Deployer",
+                    "files": [
+                        ".ward/",
+                        "setup-ward.sh",
+                        "ward-cli.sh",
+                        "ward-shell",
+                        "README.md"
+                    ]
+                }
+
+                import json
+                self._add_bytes(tar, "ward-deployment/manifest.json",
+                                json.dumps(manifest, indent=2).encode("utf-8"), 0o644)
+
+                # Create deployment script
+                self._add_bytes(tar, "ward-deployment/deploy.sh", _DEPLOY_SCRIPT.encode("utf-8"), 0o755)
 
             print(f"✓ Deployment package created: {target_dir / archive_name}")
             return True
@@ -105,22 +137,33 @@ fi
     def deploy_to_directory(self, source_package: Path, target_dir: Path) -> bool:
         """Deploy Ward from package to directory"""
         try:
-            # Extract package
-            if source_package.suffix == ".gz":
-                subprocess.run([
-                    "tar", "-xzf", str(source_package),
-                    "-C", str(target_dir)
-                ], check=True)
-            else:
-                print(f"Unsupported package format: {source_package.suffix}", file=sys.stderr)
+            # Extract package in-process; compression is detected from the contents
+            try:
+                tar = tarfile.open(source_package, "r:*")
+            except tarfile.ReadError:
+                print(f"Cannot read package {source_package}: corrupt or not a tar archive",
+                      file=sys.stderr)
                 return False
-
-            # Find and run deployment script
-            deploy_script = None
-            for root, dirs, files in os.walk(target_dir):
-                if "deploy.sh" in files:
-                    deploy_script = Path(root) / "deploy.sh"
-                    break
+            with tar:
+                # The 'data' filter rejects absolute paths, links out of
+                # target_dir and special files where this Python has it
+                if hasattr(tarfile, "data_filter"):
+                    tar.extractall(target_dir, filter="data")
+                else:
+                    root = os.path.realpath(target_dir)
+                    members = tar.getmembers()
+                    for member in members:
+                        reason = _unsafe_member(member, root)
+                        if reason is not None:
+                            print(f"Refusing to extract package: {reason}", file=sys.stderr)
+                            return False
+                    tar.extractall(target_dir, members=members)
+
+            # Packages from create_deployment_package keep it at a fixed
+            # place; only search the tree for ones laid out differently
+            deploy_script = target_dir / "ward-deployment" / "deploy.sh"
+            if not deploy_script.is_file():
+                deploy_script = next(target_dir.rglob("deploy.sh"), None)
 
             if deploy_script and deploy_script.exists():
                 result = subprocess.run([str(deploy_script)], cwd=deploy_script.parent, check=False)
@@ -4,60 +4,149 @@ Ward Favorites Management System
 Provides bookmark/favorites functionality for Ward-protected directories
 """
 
+import atexit
 import json
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import hashlib
 import secrets
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used instead
+    orjson = None
+
+
+# Linux-only; reading a policy then leaves its atime (and the inode) alone
+_O_NOATIME = getattr(os, "O_NOATIME", 0)
+
+
+def _open_policy(path: Path):
+    """Open a .ward file for text reading, without an atime update where allowed"""
+    if _O_NOATIME:
+        try:
+            return os.fdopen(os.open(path, os.O_RDONLY | os.O_CLOEXEC | _O_NOATIME), 'r')
+        except PermissionError:
+            pass  # O_NOATIME is only allowed on files we own
+    return open(path, 'r')
+
+
+def _load_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed"""
+    data = path.read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _write_json(path: Path, obj: Any, mode: int = 0o666) -> None:
+    """Write obj as indented JSON via a temp file and an atomic replace
+
+    The temp file is created with mode (subject to umask), so the replaced
+    file never exists with looser permissions.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2).encode("utf-8")
+    tmp_path = path.with_name(path.name + ".tmp")
+    # A temp file left by an interrupted save keeps its old mode; remove it
+    # so O_EXCL creates a fresh one with the requested permissions
+    try:
+        os.unlink(tmp_path)
+    except FileNotFoundError:
+        pass
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_CLOEXEC, mode)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
 class WardFavorites:
     """Manages Ward favorites with metadata and comments"""
 
+    # Threads used to refresh favorite statuses; the probes are stat/read
+    # latency bound, which matters on network mounts
+    STATUS_WORKERS = 16
+
+    # Access-count updates are written at most this often (seconds); the
+    # rest are flushed by a timer once the interval has passed, or at exit
+    ACCESS_FLUSH_INTERVAL = 2.0
+
     def __init__(self):
         self.favorites_file = Path.home() / ".ward" / "favorites.json"
         self.favorites_file.parent.mkdir(parents=True, exist_ok=True)
         self.favorites = self._load_favorites()
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        # Serializes saves from the flush timer with in-memory updates
+        self._lock = threading.RLock()
+        self._flush_timer: Optional[threading.Timer] = None
+        atexit.register(self._flush_if_dirty)
 
     def _load_favorites(self) -> Dict[str, Any]:
         """Load favorites from file"""
         if self.favorites_file.exists():
             try:
-                with open(self.favorites_file, 'r') as f:
-                    return json.load(f)
+                return _load_json(self.favorites_file)
             except (json.JSONDecodeError, IOError):
                 return {"favorites": {}, "metadata": {}}
         return {"favorites": {}, "metadata": {"created": datetime.now().isoformat()}}
 
-    def _save_favorites(self) -> bool:
-        """Save favorites to file"""
-        try:
-            self.favorites["metadata"]["last_updated"] = datetime.now().isoformat()
-            with open(self.favorites_file, 'w') as f:
-                json.dump(self.favorites, f, indent=2)
-            return True
-        except IOError:
-            return False
+    def _save_favorites(self, now: Optional[str] = None) -> bool:
+        """Save favorites to file, stamping last_updated with now if given"""
+        with self._lock:
+            # This save covers any pending access updates
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            try:
+                self.favorites["metadata"]["last_updated"] = now or datetime.now().isoformat()
+                _write_json(self.favorites_file, self.favorites)
+                self._dirty = False
+                self._last_flush = time.monotonic()
+                return True
+            except IOError:
+                return False
+
+    def _flush_if_dirty(self) -> None:
+        """Write out access updates that are still only in memory"""
+        with self._lock:
+            self._flush_timer = None
+            if self._dirty:
+                self._save_favorites()
 
     def _get_ward_status(self, path: str) -> Dict[str, Any]:
         """Get Ward protection status for a path"""
         ward_file = Path(path) / ".ward"
-        if not ward_file.exists():
-            return {"protected": False, "policy": None}
 
+        # Open directly instead of stat-then-open; a missing file shows up here
         try:
-            with open(ward_file, 'r') as f:
+            with _open_policy(ward_file) as f:
                 content = f.read()
                 return {
                     "protected": True,
                     "policy": content.strip(),
                     "readable": True
                 }
+        except (FileNotFoundError, NotADirectoryError):
+            return {"protected": False, "policy": None}
         except (IOError, PermissionError):
             return {"protected": True, "policy": None, "readable": False}
 
+    def _probe_favorite(self, path: str) -> Tuple[Dict[str, Any], bool]:
+        """Return the Ward status of a favorite and whether it still exists"""
+        ward_status = self._get_ward_status(path)
+        # A .ward that could be opened (or exists but is unreadable) already
+        # proves the directory exists; only stat it when the policy is missing
+        if ward_status["protected"]:
+            return ward_status, True
+        return ward_status, Path(path).exists()
+
     def add_favorite(self, path: str, description: str = "") -> Dict[str, Any]:
         """Add a directory to favorites"""
         path = str(Path(path).resolve())
@@ -70,35 +159,38 @@ class WardFavorites:
         if not ward_status["protected"]:
             return {"success": False, "error": "Directory is not Ward-protected"}
 
-        # Add to favorites
-        self.favorites["favorites"][path] = {
-            "description": description,
-            "added_date": datetime.now().isoformat(),
-            "last_accessed": datetime.now().isoformat(),
-            "comments": [],
-            "ward_status": ward_status,
-            "access_count": 0
-        }
+        # Add to favorites; one timestamp covers the whole operation
+        now = datetime.now().isoformat()
+        with self._lock:
+            self.favorites["favorites"][path] = {
+                "description": description,
+                "added_date": now,
+                "last_accessed": now,
+                "comments": [],
+                "ward_status": ward_status,
+                "access_count": 0
+            }
+            saved = self._save_favorites(now)
 
-        if self._save_favorites():
+        if saved:
             return {"success": True, "message": "Added to favorites"}
         else:
             return {"success": False, "error": "Failed to save favorites"}
 
     def get_favorites(self) -> List[Dict[str, Any]]:
         """Get all favorites with metadata"""
-        favorites_list = []
+        favorites = self.favorites["favorites"]
+        if not favorites:
+            return []
 
-        for path, data in self.favorites["favorites"].items():
-            # Refresh ward status
-            ward_status = self._get_ward_status(path)
+        # Refresh ward status and existence for all favorites concurrently
+        with ThreadPoolExecutor(max_workers=min(self.STATUS_WORKERS, len(favorites))) as pool:
+            probes = pool.map(self._probe_favorite, favorites)
 
-            # Get recent comments (last 3)
-            recent_comments = sorted(
-                data["comments"],
-                key=lambda x: x.get("timestamp", ""),
-                reverse=True
-            )[:3]
+        favorites_list = []
+        for (path, data), (ward_status, exists) in zip(favorites.items(), probes):
+            # Get recent comments (last 3); the list is already in time order
+            recent_comments = data["comments"][-3:][::-1]
 
             favorites_list.append({
                 "path": path,
@@ -108,7 +200,7 @@ class WardFavorites:
                 "access_count": data.get("access_count", 0),
                 "ward_status": ward_status,
                 "recent_comments": recent_comments,
-                "exists": Path(path).exists()
+                "exists": exists
             })
 
         # Sort by last accessed
@@ -126,15 +218,19 @@ class WardFavorites:
         if path not in self.favorites["favorites"]:
             return {"success": False, "error": "Path not in favorites"}
 
+        now = datetime.now().isoformat()
         comment_data = {
             "comment": comment,
             "author": author,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now
         }
 
-        self.favorites["favorites"][path]["comments"].append(comment_data)
+        # Appending keeps comments in timestamp order, which get_favorites relies on
+        with self._lock:
+            self.favorites["favorites"][path]["comments"].append(comment_data)
+            saved = self._save_favorites(now)
 
-        if self._save_favorites():
+        if saved:
             return {"success": True, "message": "Comment added"}
         else:
             return {"success": False, "error": "Failed to save comment"}
@@ -143,10 +239,22 @@ class WardFavorites:
         """Update access information for a favorite"""
         path = str(Path(path).resolve())
 
-        if path in self.favorites["favorites"]:
-            self.favorites["favorites"][path]["last_accessed"] = datetime.now().isoformat()
+        if path not in self.favorites["favorites"]:
+            return
+
+        now = datetime.now().isoformat()
+        with self._lock:
+            self.favorites["favorites"][path]["last_accessed"] = now
             self.favorites["favorites"][path]["access_count"] += 1
-            self._save_favorites()
+            self._dirty = True
+            if time.monotonic() - self._last_flush > self.ACCESS_FLUSH_INTERVAL:
+                self._save_favorites(now)
+            elif self._flush_timer is None:
+                # Long-running callers (the MCP server) may be stopped by a
+                # signal, which skips atexit; flush on a timer instead
+                self._flush_timer = threading.Timer(self.ACCESS_FLUSH_INTERVAL, self._flush_if_dirty)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
 
 
 class WardPlanter:
@@ -161,8 +269,7 @@ class WardPlanter:
         """Load Ward passwords"""
         if self.passwords_file.exists():
             try:
-                with open(self.passwords_file, 'r') as f:
-                    return json.load(f)
+                return _load_json(self.passwords_file)
             except (json.JSONDecodeError, IOError):
                 return {}
         return {}
@@ -170,10 +277,8 @@ class WardPlanter:
     def _save_passwords(self) -> bool:
         """Save Ward passwords"""
         try:
-            with open(self.passwords_file, 'w') as f:
-                json.dump(self.passwords, f, indent=2)
-            # Set restrictive permissions
-            os.chmod(self.passwords_file, 0o600)
+            # Created owner-only from the start rather than chmod'ed afterwards
+            _write_json(self.passwords_file, self.passwords, 0o600)
             return True
         except IOError:
             return False
@@ -182,9 +287,10 @@ class WardPlanter:
         """Generate a random password for Ward"""
         return secrets.token_urlsafe(16)
 
-    def plant_ward(self, path: str, description: str = "", ai_initiated: bool = False) -> Dict[str, Any]:
+    def plant_ward(self, path: str, description: str = "", ai_initiated: bool = False,
+                   resolved: Optional[Path] = None) -> Dict[str, Any]:
         """Plant a Ward in a directory with permission management"""
-        path = Path(path).resolve()
+        path = resolved if resolved is not None else Path(path).resolve()
 
         if not path.exists():
             return {"success": False, "error": "Path does not exist"}
@@ -220,12 +326,11 @@ class WardPlanter:
 """
 
         try:
-            # Create .ward file
-            with open(existing_ward, 'w') as f:
-                f.write(ward_config)
-
-            # Set restrictive permissions
-            os.chmod(existing_ward, 0o600)
+            # Create .ward with restrictive permissions in a single write;
+            # O_EXCL also refuses a .ward that appeared since the check above
+            fd = os.open(existing_ward, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(ward_config.encode("utf-8"))
 
             return {
                 "success": True,
@@ -242,9 +347,9 @@ class WardPlanter:
                 self._save_passwords()
             return {"success": False, "error": f"Failed to create Ward: {str(e)}"}
 
-    def get_ward_info(self, path: str) -> Dict[str, Any]:
+    def get_ward_info(self, path: str, resolved: Optional[Path] = None) -> Dict[str, Any]:
         """Get Ward information including password protection status"""
-        path = Path(path).resolve()
+        path = resolved if resolved is not None else Path(path).resolve()
         ward_file = path / ".ward"
 
         if not ward_file.exists():
@@ -253,7 +358,7 @@ class WardPlanter:
         has_password = str(path) in self.passwords
 
         try:
-            with open(ward_file, 'r') as f:
+            with _open_policy(ward_file) as f:
                 content = f.read()
 
             return {
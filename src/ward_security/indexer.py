@@ -107,38 +107,40 @@ class WardIndexer:
 
         try:
             last_modified = 0
-            for item in path.iterdir():
-                if item.name.startswith('.'):
-                    continue
-
-                if item.is_file():
-                    file_info = {
-                        "name": item.name,
-                        "size": item.stat().st_size,
-                        "modified": datetime.fromtimestamp(item.stat().st_mtime).isoformat(),
-                        "extension": item.suffix.lower()
-                    }
-                    content_info["files"].append(file_info)
-                    content_info["total_size"] += file_info["size"]
-
-                    # Track file types
-                    ext = item.suffix.lower()
-                    content_info["file_types"][ext] = content_info["file_types"].get(ext, 0) + 1
-
-                    mod_time = item.stat().st_mtime
-                    if mod_time > last_modified:
-                        last_modified = mod_time
-
-                elif item.is_dir():
-                    dir_info = {
-                        "name": item.name,
-                        "modified": datetime.fromtimestamp(item.stat().st_mtime).isoformat()
-                    }
-                    content_info["directories"].append(dir_info)
-
-                    mod_time = item.stat().st_mtime
-                    if mod_time > last_modified:
-                        last_modified = mod_time
+            # scandir entries carry the file type, and each entry is stat'ed once
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+
+                    if entry.is_file():
+                        st = entry.stat()
+                        ext = Path(entry.name).suffix.lower()
+                        file_info = {
+                            "name": entry.name,
+                            "size": st.st_size,
+                            "modified": datetime.fromtimestamp(st.st_mtime).isoformat(),
+                            "extension": ext
+                        }
+                        content_info["files"].append(file_info)
+                        content_info["total_size"] += file_info["size"]
+
+                        # Track file types
+                        content_info["file_types"][ext] = content_info["file_types"].get(ext, 0) + 1
+
+                    elif entry.is_dir():
+                        st = entry.stat()
+                        dir_info = {
+                            "name": entry.name,
+                            "modified": datetime.fromtimestamp(st.st_mtime).isoformat()
+                        }
+                        content_info["directories"].append(dir_info)
+
+                    else:
+                        continue
+
+                    if st.st_mtime > last_modified:
+                        last_modified = st.st_mtime
 
             if last_modified > 0:
                 content_info["last_modified"] = datetime.fromtimestamp(last_modified).isoformat()
@@ -24,7 +24,8 @@ class WardShell:
 
         try:
             # Ensure the shell is executable
-            os.chmod(self.ward_shell_path, 0o755)
+            if not os.access(self.ward_shell_path, os.X_OK):
+                os.chmod(self.ward_shell_path, 0o755)
 
             # Execute the Ward shell
             result = subprocess.run(